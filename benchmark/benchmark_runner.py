@@ -22,9 +22,12 @@ Test metrics:
 - Resource Usage (CPU/Memory)
 """
 
+import functools
 import json
 import os
 import platform
+import re
+import selectors
 import shutil
 import statistics
 import subprocess
@@ -42,6 +45,11 @@ PROJECT_ROOT = Path(__file__).parent.parent
 SKILLS_DIR = PROJECT_ROOT / ".skills"
 CALCULATOR_SKILL = SKILLS_DIR / "calculator"
 
+# Host OS, looked up once rather than on every measured run
+PLATFORM_SYSTEM = platform.system()
+_IS_MACOS = PLATFORM_SYSTEM == "Darwin"
+_TIME_BIN = "/usr/bin/time"
+
 # SkillLite binary path
 SKILLLITE_BIN = shutil.which("skilllite") or str(PROJECT_ROOT / "skilllite" / "target" / "release" / "skilllite")
 
@@ -85,6 +93,7 @@ class BenchmarkStats:
     total_time_sec: float
     avg_memory_mb: float = 0.0  # Average memory usage in MB
     peak_memory_mb: float = 0.0  # Peak memory usage in MB
+    iqr_latency_ms: float = 0.0  # p75 - p25, spread without the tails
     
     def to_dict(self) -> dict:
         return {
@@ -99,6 +108,7 @@ class BenchmarkStats:
                 "p50": round(self.p50_latency_ms, 2),
                 "p95": round(self.p95_latency_ms, 2),
                 "p99": round(self.p99_latency_ms, 2),
+                "iqr": round(self.iqr_latency_ms, 2),
             },
             "throughput_rps": round(self.throughput_rps, 2),
             "total_time_sec": round(self.total_time_sec, 2),
@@ -109,6 +119,11 @@ class BenchmarkStats:
         }
 
 
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading, converted once"""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
 def percentile(data: List[float], p: float) -> float:
     """Calculate percentile"""
     if not data:
@@ -118,111 +133,139 @@ def percentile(data: List[float], p: float) -> float:
     return sorted_data[min(index, len(sorted_data) - 1)]
 
 
+def interquartile_range(data: List[float]) -> float:
+    """Calculate p75 - p25"""
+    return percentile(data, 75) - percentile(data, 25)
+
+
+# Below this many samples the tail percentiles are just the largest values
+MIN_PERCENTILE_SAMPLES = 10
+
+
+# Most output kept per stream from a measured run
+MAX_CAPTURE_BYTES = 64 * 1024
+
+# Peak RSS line of /usr/bin/time: macOS -l prints "<bytes>  maximum resident set size",
+# Linux -v prints "Maximum resident set size (kbytes): <kb>"
+_MACOS_RSS_RE = re.compile(rb"(\d+)\s+maximum resident set size", re.IGNORECASE)
+_LINUX_RSS_RE = re.compile(rb"maximum resident set size[^\d\n]*(\d+)", re.IGNORECASE)
+
+
+def _run_capped(command: list, timeout: float, input_data: Optional[bytes] = None,
+                max_bytes: int = MAX_CAPTURE_BYTES, **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run(capture_output=True) that keeps at most max_bytes per stream
+
+    Both pipes are drained until the child exits, so it is never blocked or
+    cut short. stdout keeps its first max_bytes; stderr keeps its last
+    max_bytes, because /usr/bin/time appends its report there after the
+    child's own output. Raises subprocess.TimeoutExpired like subprocess.run.
+    """
+    deadline = time.monotonic() + timeout
+    proc = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE if input_data is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **kwargs
+    )
+    stdout, stderr = bytearray(), bytearray()
+    pending = memoryview(input_data or b"")
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ, stdout)
+            selector.register(proc.stderr, selectors.EVENT_READ, stderr)
+            if proc.stdin:
+                if pending:
+                    os.set_blocking(proc.stdin.fileno(), False)
+                    selector.register(proc.stdin, selectors.EVENT_WRITE)
+                else:
+                    proc.stdin.close()
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in selector.select(remaining):
+                    if key.fileobj is proc.stdin:
+                        try:
+                            pending = pending[os.write(key.fd, pending[:65536]):]
+                        except BrokenPipeError:
+                            pending = pending[:0]
+                        if not pending:
+                            selector.unregister(proc.stdin)
+                            proc.stdin.close()
+                        continue
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        selector.unregister(key.fileobj)
+                        continue
+                    buffer = key.data
+                    if buffer is stdout:
+                        buffer += chunk[:max_bytes - len(buffer)]
+                    else:
+                        buffer += chunk
+                        del buffer[:-max_bytes]
+        proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    finally:
+        for pipe in (proc.stdin, proc.stdout, proc.stderr):
+            if pipe:
+                pipe.close()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    return subprocess.CompletedProcess(command, proc.returncode, bytes(stdout), bytes(stderr))
+
+
 class ResourceMonitor:
     """Resource monitor - measures process memory consumption"""
 
-    @staticmethod
-    def get_peak_memory_kb(command: list, cwd: str = None, timeout: int = 30, input_data: str = None, env: dict = None) -> tuple:
+    def __init__(self):
+        if _IS_MACOS:
+            # macOS: use /usr/bin/time -l, RSS reported in bytes
+            self._time_cmd = [_TIME_BIN, "-l"]
+            self._rss_re = _MACOS_RSS_RE
+            self._rss_divisor = 1024.0
+        else:
+            # Linux: use /usr/bin/time -v, RSS reported in kB
+            self._time_cmd = [_TIME_BIN, "-v"]
+            self._rss_re = _LINUX_RSS_RE
+            self._rss_divisor = 1.0
+
+    def get_peak_memory_kb(self, command: list, cwd: str = None, timeout: int = 30, input_data: str = None, env: dict = None) -> tuple:
         """
         Run command and get peak memory usage
         Returns: (elapsed_ms, success, stdout, stderr, peak_memory_kb)
         """
-        is_macos = platform.system() == "Darwin"
-
-        if is_macos:
-            # macOS: use /usr/bin/time -l
-            full_command = ["/usr/bin/time", "-l"] + command
-            start = time.perf_counter()
-            try:
-                # Merge with current environment if env is provided
-                run_env = os.environ.copy()
-                if env:
-                    run_env.update(env)
-                
-                result = subprocess.run(
-                    full_command,
-                    capture_output=True,
-                    timeout=timeout,
-                    cwd=cwd,
-                    input=input_data.encode() if input_data else None,
-                    text=False if input_data else True,
-                    env=run_env if env else None
-                )
-                end = time.perf_counter()
-                elapsed_ms = (end - start) * 1000
-                
-                stderr_text = result.stderr.decode(errors='replace') if isinstance(result.stderr, bytes) else result.stderr
-                # macOS time output format: "maximum resident set size" in bytes
-                memory_kb = 0
-                for line in stderr_text.split('\n'):
-                    if 'maximum resident set size' in line.lower():
-                        try:
-                            # Extract number (bytes)
-                            parts = line.strip().split()
-                            memory_bytes = int(parts[0])
-                            memory_kb = memory_bytes / 1024
-                        except (ValueError, IndexError):
-                            pass
-                        break
-                
-                stdout_text = result.stdout.decode(errors='replace') if isinstance(result.stdout, bytes) else result.stdout
-                return (
-                    elapsed_ms,
-                    result.returncode == 0,
-                    stdout_text,
-                    stderr_text,
-                    memory_kb
-                )
-            except subprocess.TimeoutExpired:
-                return (timeout * 1000, False, "", "Timeout", 0)
-            except Exception as e:
-                return (0, False, "", str(e), 0)
-        else:
-            # Linux: use /usr/bin/time -v
-            full_command = ["/usr/bin/time", "-v"] + command
-            start = time.perf_counter()
-            try:
-                # Merge with current environment if env is provided
-                run_env = os.environ.copy()
-                if env:
-                    run_env.update(env)
-                
-                result = subprocess.run(
-                    full_command,
-                    capture_output=True,
-                    timeout=timeout,
-                    cwd=cwd,
-                    input=input_data.encode() if input_data else None,
-                    text=False if input_data else True,
-                    env=run_env if env else None
-                )
-                end = time.perf_counter()
-                elapsed_ms = (end - start) * 1000
-                
-                stderr_text = result.stderr.decode(errors='replace') if isinstance(result.stderr, bytes) else result.stderr
-                # Linux time output format: "Maximum resident set size (kbytes):"
-                memory_kb = 0
-                for line in stderr_text.split('\n'):
-                    if 'maximum resident set size' in line.lower():
-                        try:
-                            parts = line.strip().split(':')
-                            memory_kb = float(parts[-1].strip())
-                        except (ValueError, IndexError):
-                            pass
-                        break
-                
-                stdout_text = result.stdout.decode(errors='replace') if isinstance(result.stdout, bytes) else result.stdout
-                return (
-                    elapsed_ms,
-                    result.returncode == 0,
-                    stdout_text,
-                    stderr_text,
-                    memory_kb
-                )
-            except subprocess.TimeoutExpired:
-                return (timeout * 1000, False, "", "Timeout", 0)
-            except Exception as e:
-                return (0, False, "", str(e), 0)
+        full_command = self._time_cmd + command
+        start = time.perf_counter_ns()
+        try:
+            # Merge with current environment if env is provided
+            run_env = os.environ.copy()
+            if env:
+                run_env.update(env)
+            
+            result = _run_capped(
+                full_command,
+                timeout=timeout,
+                input_data=input_data.encode() if input_data else None,
+                cwd=cwd,
+                env=run_env if env else None
+            )
+            elapsed_ms = _elapsed_ms(start)
+            
+            match = self._rss_re.search(result.stderr)
+            memory_kb = int(match.group(1)) / self._rss_divisor if match else 0
+            
+            return (
+                elapsed_ms,
+                result.returncode == 0,
+                result.stdout.decode(errors='replace'),
+                result.stderr.decode(errors='replace'),
+                memory_kb
+            )
+        except subprocess.TimeoutExpired:
+            return (timeout * 1000, False, "", "Timeout", 0)
+        except Exception as e:
+            return (0, False, "", str(e), 0)
 
 
 class BaseExecutor:
@@ -295,7 +338,7 @@ class SkillLiteExecutor(BaseExecutor):
                 )
         else:
             # Original implementation without memory measurement
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
             try:
                 # Set environment variable to pass sandbox level and skills root
                 env = os.environ.copy()
@@ -312,7 +355,7 @@ class SkillLiteExecutor(BaseExecutor):
                     timeout=30,
                     env=env
                 )
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 
                 return BenchmarkResult(
                     executor_name=self.name,
@@ -323,7 +366,7 @@ class SkillLiteExecutor(BaseExecutor):
                     error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
                 )
             except subprocess.TimeoutExpired:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -331,7 +374,7 @@ class SkillLiteExecutor(BaseExecutor):
                     error="Timeout"
                 )
             except Exception as e:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -375,14 +418,14 @@ class SkillLiteIPCExecutor(BaseExecutor):
                 executor_name=self.name, success=False, latency_ms=0,
                 error="IPC client not initialized"
             )
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         try:
             res = self._client.run(
                 str(self.skill_dir),
                 input_json,
                 sandbox_level=self.sandbox_level,
             )
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ms = _elapsed_ms(start_time)
             output = res.get("output", "")
             exit_code = res.get("exit_code", 0)
             return BenchmarkResult(
@@ -394,7 +437,7 @@ class SkillLiteIPCExecutor(BaseExecutor):
                 error=None if exit_code == 0 else f"Exit code: {exit_code}",
             )
         except Exception as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ms = _elapsed_ms(start_time)
             return BenchmarkResult(
                 executor_name=self.name,
                 success=False,
@@ -476,7 +519,7 @@ CMD ["python", "/app/main.py"]
             
             try:
                 container_name = f"benchmark-{uuid.uuid4().hex[:8]}"
-                start_time = time.perf_counter()
+                start_time = time.perf_counter_ns()
                 
                 # Start container in detached mode; override CMD with sleep so container stays
                 # running (default CMD runs main.py which needs stdin and would exit immediately)
@@ -550,7 +593,7 @@ CMD ["python", "/app/main.py"]
                 time.sleep(0.2)
                 monitor_thread.join(timeout=0.5)
                 
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                elapsed_ms = _elapsed_ms(start_time)
                 
                 # Use peak memory or fallback estimate
                 memory_kb = peak_memory_kb[0] if peak_memory_kb[0] > 0 else 150 * 1024
@@ -582,7 +625,7 @@ CMD ["python", "/app/main.py"]
                     memory_kb=0
                 )
         else:
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
             try:
                 result = subprocess.run(
                     [
@@ -598,7 +641,7 @@ CMD ["python", "/app/main.py"]
                     text=True,
                     timeout=30
                 )
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 
                 return BenchmarkResult(
                     executor_name=self.name,
@@ -609,7 +652,7 @@ CMD ["python", "/app/main.py"]
                     error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
                 )
             except subprocess.TimeoutExpired:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -617,7 +660,7 @@ CMD ["python", "/app/main.py"]
                     error="Timeout"
                 )
             except Exception as e:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -655,8 +698,8 @@ class GvisorExecutor(BaseExecutor):
         self.setup_error = None  # Store error message for later reporting
         
         # Check platform - gVisor only supports Linux
-        if platform.system() != "Linux":
-            self.setup_error = f"gVisor only supports Linux (current: {platform.system()}). Use Linux or skip gVisor test."
+        if PLATFORM_SYSTEM != "Linux":
+            self.setup_error = f"gVisor only supports Linux (current: {PLATFORM_SYSTEM}). Use Linux or skip gVisor test."
             print(f"[WARN] {self.setup_error}")
             return
         
@@ -758,7 +801,7 @@ CMD ["python", "/app/main.py"]
             
             try:
                 container_name = f"benchmark-gvisor-{uuid.uuid4().hex[:8]}"
-                start_time = time.perf_counter()
+                start_time = time.perf_counter_ns()
                 
                 # Start container with gVisor runtime in detached mode; override CMD so it stays running
                 create_result = subprocess.run(
@@ -831,7 +874,7 @@ CMD ["python", "/app/main.py"]
                 time.sleep(0.2)
                 monitor_thread.join(timeout=0.5)
                 
-                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                elapsed_ms = _elapsed_ms(start_time)
                 memory_kb = peak_memory_kb[0] if peak_memory_kb[0] > 0 else 150 * 1024
                 
                 # Clean up container
@@ -860,7 +903,7 @@ CMD ["python", "/app/main.py"]
                     memory_kb=0
                 )
         else:
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
             try:
                 # Use gVisor runtime with Docker
                 result = subprocess.run(
@@ -878,7 +921,7 @@ CMD ["python", "/app/main.py"]
                     text=True,
                     timeout=30
                 )
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 
                 return BenchmarkResult(
                     executor_name=self.name,
@@ -889,7 +932,7 @@ CMD ["python", "/app/main.py"]
                     error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
                 )
             except subprocess.TimeoutExpired:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -897,7 +940,7 @@ CMD ["python", "/app/main.py"]
                     error="Timeout"
                 )
             except Exception as e:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -925,7 +968,7 @@ class SubprocessResourceLimitExecutor(BaseExecutor):
             print(f"[WARN] Resource limits not available on this platform")
         
     def execute(self, input_json: str) -> BenchmarkResult:
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         try:
             preexec_fn = None
             
@@ -949,7 +992,7 @@ class SubprocessResourceLimitExecutor(BaseExecutor):
                 timeout=30,
                 preexec_fn=preexec_fn
             )
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ms = _elapsed_ms(start_time)
             
             return BenchmarkResult(
                 executor_name=self.name,
@@ -960,7 +1003,7 @@ class SubprocessResourceLimitExecutor(BaseExecutor):
                 error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
             )
         except subprocess.TimeoutExpired:
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ms = _elapsed_ms(start_time)
             return BenchmarkResult(
                 executor_name=self.name,
                 success=False,
@@ -968,7 +1011,7 @@ class SubprocessResourceLimitExecutor(BaseExecutor):
                 error="Timeout"
             )
         except Exception as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ms = _elapsed_ms(start_time)
             return BenchmarkResult(
                 executor_name=self.name,
                 success=False,
@@ -977,6 +1020,44 @@ class SubprocessResourceLimitExecutor(BaseExecutor):
             )
 
 
+@functools.lru_cache(maxsize=None)
+def find_srt_bin() -> Optional[str]:
+    """Locate the srt binary once; cold-start runs call setup() every iteration"""
+    # First try which
+    srt_bin = shutil.which("srt") or shutil.which("sandbox-runtime")
+
+    if not srt_bin:
+        # Try to find from npm global path
+        try:
+            npm_global = subprocess.run(
+                ["npm", "root", "-g"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            if npm_global.returncode == 0:
+                npm_path = Path(npm_global.stdout.strip())
+                possible_paths = [
+                    npm_path.parent / "bin" / "srt",
+                    npm_path / "@anthropic-ai" / "sandbox-runtime" / "bin" / "srt",
+                ]
+                for p in possible_paths:
+                    if p.exists():
+                        srt_bin = str(p)
+                        break
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+    
+    # Try common nvm paths
+    if not srt_bin:
+        home = Path.home()
+        nvm_paths = list(home.glob(".nvm/versions/node/*/bin/srt"))
+        if nvm_paths:
+            srt_bin = str(nvm_paths[-1])  # Use latest version
+    
+    return srt_bin
+
+
 class SRTExecutor(BaseExecutor):
     """SRT (Sandbox Runtime) Executor - Open source sandbox tool by Anthropic
 
@@ -997,37 +1078,7 @@ class SRTExecutor(BaseExecutor):
         self.resource_monitor = ResourceMonitor() if measure_memory else None
         
     def setup(self) -> None:
-        # First try which
-        self.srt_bin = shutil.which("srt") or shutil.which("sandbox-runtime")
-
-        if not self.srt_bin:
-            # Try to find from npm global path
-            try:
-                npm_global = subprocess.run(
-                    ["npm", "root", "-g"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if npm_global.returncode == 0:
-                    npm_path = Path(npm_global.stdout.strip())
-                    possible_paths = [
-                        npm_path.parent / "bin" / "srt",
-                        npm_path / "@anthropic-ai" / "sandbox-runtime" / "bin" / "srt",
-                    ]
-                    for p in possible_paths:
-                        if p.exists():
-                            self.srt_bin = str(p)
-                            break
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
-        
-        # Try common nvm paths
-        if not self.srt_bin:
-            home = Path.home()
-            nvm_paths = list(home.glob(".nvm/versions/node/*/bin/srt"))
-            if nvm_paths:
-                self.srt_bin = str(nvm_paths[-1])  # Use latest version
+        self.srt_bin = find_srt_bin()
         
         if self.srt_bin:
             self.srt_available = True
@@ -1069,7 +1120,7 @@ class SRTExecutor(BaseExecutor):
                     memory_kb=0
                 )
         else:
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
             try:
                 # SRT command format: srt [command...] (no need for run subcommand)
                 result = subprocess.run(
@@ -1079,7 +1130,7 @@ class SRTExecutor(BaseExecutor):
                     text=True,
                     timeout=30
                 )
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 
                 return BenchmarkResult(
                     executor_name=self.name,
@@ -1090,7 +1141,7 @@ class SRTExecutor(BaseExecutor):
                     error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
                 )
             except subprocess.TimeoutExpired:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -1098,7 +1149,7 @@ class SRTExecutor(BaseExecutor):
                     error="Timeout"
                 )
             except Exception as e:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -1180,22 +1231,16 @@ class PyodideExecutor(BaseExecutor):
             print("[WARN] Pyodide runner script not found")
             return
 
-        # Write Python code to temporary file
-        self.python_code_file = Path(tempfile.gettempdir()) / f"pyodide_python_code_{os.getpid()}.py"
-        python_code = self.script_path.read_text()
-        self.python_code_file.write_text(python_code)
+        # The runner reads the skill script itself; no per-setup copy to rewrite
+        self.python_code_file = self.script_path
         
         # Verify file exists and is readable
         if not self.python_code_file.exists():
-            print(f"[WARN] Failed to create Python code file: {self.python_code_file}")
+            print(f"[WARN] Python code file not found: {self.python_code_file}")
             return
         
         self.pyodide_available = True
     
-    def teardown(self) -> None:
-        if self.python_code_file and self.python_code_file.exists():
-            self.python_code_file.unlink()
-    
     def execute(self, input_json: str) -> BenchmarkResult:
         if not self.pyodide_available:
             return BenchmarkResult(
@@ -1259,7 +1304,7 @@ class PyodideExecutor(BaseExecutor):
                     memory_kb=0
                 )
         else:
-            start_time = time.perf_counter()
+            start_time = time.perf_counter_ns()
             try:
                 # Verify Python code file exists
                 if not self.python_code_file or not self.python_code_file.exists():
@@ -1284,7 +1329,7 @@ class PyodideExecutor(BaseExecutor):
                     env=env,
                     cwd=str(self.pyodide_runner.parent.absolute()) if self.pyodide_runner.parent else None
                 )
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 
                 # Check for Pyodide errors in output
                 if result.returncode != 0 or (result.stdout and "Pyodide error" in result.stdout):
@@ -1309,7 +1354,7 @@ class PyodideExecutor(BaseExecutor):
                     error=None if result.returncode == 0 else f"Exit code: {result.returncode}"
                 )
             except subprocess.TimeoutExpired:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -1317,7 +1362,7 @@ class PyodideExecutor(BaseExecutor):
                     error="Timeout"
                 )
             except Exception as e:
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ms = _elapsed_ms(start_time)
                 return BenchmarkResult(
                     executor_name=self.name,
                     success=False,
@@ -1383,7 +1428,7 @@ def run_concurrent_benchmark(
     if not latencies:
         latencies = [0.0]
     
-    avg_memory_mb = statistics.mean(memory_values) if memory_values else 0.0
+    avg_memory_mb = statistics.fmean(memory_values) if memory_values else 0.0
     peak_memory_mb = max(memory_values) if memory_values else 0.0
     
     stats = BenchmarkStats(
@@ -1393,20 +1438,23 @@ def run_concurrent_benchmark(
         failed_requests=len(failed),
         min_latency_ms=min(latencies),
         max_latency_ms=max(latencies),
-        avg_latency_ms=statistics.mean(latencies),
+        avg_latency_ms=statistics.fmean(latencies),
         p50_latency_ms=percentile(latencies, 50),
         p95_latency_ms=percentile(latencies, 95),
         p99_latency_ms=percentile(latencies, 99),
         throughput_rps=len(successful) / total_time if total_time > 0 else 0,
         total_time_sec=total_time,
         avg_memory_mb=avg_memory_mb,
-        peak_memory_mb=peak_memory_mb
+        peak_memory_mb=peak_memory_mb,
+        iqr_latency_ms=interquartile_range(latencies)
     )
     
     print(f"\nResults for {executor.name}:")
     print(f"  Success Rate: {len(successful)}/{num_requests} ({len(successful) * 100 // num_requests}%)")
     print(f"  Latency (ms): min={stats.min_latency_ms:.2f}, avg={stats.avg_latency_ms:.2f}, max={stats.max_latency_ms:.2f}")
-    print(f"  Percentiles (ms): p50={stats.p50_latency_ms:.2f}, p95={stats.p95_latency_ms:.2f}, p99={stats.p99_latency_ms:.2f}")
+    print(f"  Percentiles (ms): p50={stats.p50_latency_ms:.2f}, p95={stats.p95_latency_ms:.2f}, p99={stats.p99_latency_ms:.2f}, IQR={stats.iqr_latency_ms:.2f}")
+    if 0 < len(successful) < MIN_PERCENTILE_SAMPLES:
+        print(f"  [WARN] Only {len(successful)} successful requests; percentiles are approximate, compare min/max instead")
     if stats.avg_memory_mb > 0:
         print(f"  Memory (MB): avg={stats.avg_memory_mb:.2f}, peak={stats.peak_memory_mb:.2f}")
     print(f"  Throughput: {stats.throughput_rps:.2f} req/s")
@@ -1463,12 +1511,15 @@ def run_cold_start_benchmark(executor: BaseExecutor, input_json: str, iterations
             "successful": len(latencies),
             "min_ms": round(min(latencies), 2),
             "max_ms": round(max(latencies), 2),
-            "avg_ms": round(statistics.mean(latencies), 2),
+            "avg_ms": round(statistics.fmean(latencies), 2),
             "p50_ms": round(percentile(latencies, 50), 2),
             "p95_ms": round(percentile(latencies, 95), 2),
+            "iqr_ms": round(interquartile_range(latencies), 2),
         }
         print(f"\nCold Start Summary:")
-        print(f"  Avg: {stats['avg_ms']:.2f}ms, P50: {stats['p50_ms']:.2f}ms, P95: {stats['p95_ms']:.2f}ms")
+        print(f"  Avg: {stats['avg_ms']:.2f}ms, P50: {stats['p50_ms']:.2f}ms, P95: {stats['p95_ms']:.2f}ms, IQR: {stats['iqr_ms']:.2f}ms")
+        if len(latencies) < MIN_PERCENTILE_SAMPLES:
+            print(f"  [WARN] Only {len(latencies)} successful iterations; percentiles are approximate, compare min/max instead")
         return stats
     
     return {"executor": executor.name, "error": "All iterations failed"}
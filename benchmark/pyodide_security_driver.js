@@ -0,0 +1,53 @@
+const { loadPyodide } = require("pyodide");
+const readline = require("readline");
+
+// Persistent Pyodide worker for security_vs.py
+//
+// Loads Pyodide once, then reads newline-delimited JSON requests
+// {"id": ..., "code": "..."} from stdin and answers each with one line
+// {"id": ..., "output": "..."} on stdout. Every test runs with a fresh
+// globals dict; output holds what the test printed, up to MAX_OUTPUT_CHARS.
+
+// Same cap security_vs.py puts on the other platforms' child output
+const MAX_OUTPUT_CHARS = 64 * 1024;
+
+async function main() {
+    const pyodide = await loadPyodide();
+    process.stdout.write(JSON.stringify({ ready: true }) + "\n");
+
+    const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    for await (const line of rl) {
+        if (!line.trim()) {
+            continue;
+        }
+        const { id, code } = JSON.parse(line);
+
+        let output = "";
+        const capture = {
+            batched: (text) => {
+                if (output.length < MAX_OUTPUT_CHARS) {
+                    output += (text + "\n").slice(0, MAX_OUTPUT_CHARS - output.length);
+                }
+            },
+        };
+        pyodide.setStdout(capture);
+        pyodide.setStderr(capture);
+
+        const globals = pyodide.globals.get("dict")();
+        try {
+            await pyodide.runPythonAsync(code, { globals });
+        } catch (e) {
+            // Same shape as the tests' own json.dumps() output
+            output += '{"result": "BLOCKED", "error": ' + JSON.stringify(e.message) + "}\n";
+        } finally {
+            globals.destroy();
+        }
+
+        process.stdout.write(JSON.stringify({ id, output }) + "\n");
+    }
+}
+
+main().catch((e) => {
+    console.error("Pyodide driver error:", e.message);
+    process.exit(1);
+});
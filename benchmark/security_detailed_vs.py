@@ -9,6 +9,7 @@ This script more precisely tests sandbox security behavior, distinguishing:
 
 Test dimensions:
 - os.listdir('/') - Distinguish: throws exception vs returns empty list vs returns full list
+- os.scandir('/') - Same as above, via the dirent-based API real directory walkers use
 - os.system() - Distinguish: function not callable vs command execution failed vs command execution succeeded
 - subprocess - Distinguish: module not importable vs execution failed vs execution succeeded
 - File read/write - Distinguish: permission denied vs file not found vs success
@@ -16,13 +17,22 @@ Test dimensions:
 
 import subprocess
 import os
+import atexit
+import functools
+import hashlib
+import io
 import tempfile
 import shutil
 import json
+import marshal
+import queue
+import select
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import BinaryIO, Optional, Dict, List, Tuple
 
 class DetailedResult(Enum):
     """Detailed security test result"""
@@ -30,22 +40,101 @@ class DetailedResult(Enum):
     EFFECT_LIMITED = "🛡️ Effect Limited"       # Function callable but effect is limited
     FULLY_ALLOWED = "❌ Fully Allowed"          # Operation completely succeeded
     ERROR = "⚙️ Test Error"                     # Test execution error
+    TIMEOUT = "⏱️ Timeout"                      # Ran out of time, inconclusive
     SKIPPED = "⏭️ Skipped"                      # Test was skipped
 
-@dataclass
+# Test scripts report through _emit(), which frames the JSON result with these
+# markers so the harness can cut it out of noisy sandbox output directly
+JSON_BEGIN = b"__JSON_BEGIN__\n"
+JSON_END = b"\n__JSON_END__"
+
+# The payload is written as UTF-8 bytes with ensure_ascii=False, so non-ASCII
+# paths and messages aren't inflated into \uXXXX escapes on the pipe
+EMIT_PRELUDE = """\
+import json as _json, sys as _sys
+def _emit(result):
+    payload = _json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+    _sys.stdout.flush()
+    _sys.stdout.buffer.write(b"__JSON_BEGIN__\\n" + payload.encode("utf-8", "replace") + b"\\n__JSON_END__\\n")
+    _sys.stdout.buffer.flush()
+"""
+
+
+@dataclass(frozen=True)
 class DetailedSecurityTest:
-    """Detailed security test case"""
+    """Detailed security test case
+
+    EMIT_PRELUDE is prepended to code, so test bodies report with _emit(result).
+    """
     name: str
     category: str
     description: str
     code: str
-    timeout: int = 10
+    timeout: int = 10  # Seconds for the test body itself
+    # Names from HOST_CONSTANTS to resolve once and prepend to code
+    host_constants: Tuple[str, ...] = ()
+    # Tests whose FUNCTION_BLOCKED conclusion on a platform implies this one's,
+    # so it is reported as blocked there without being run
+    requires: Tuple[str, ...] = ()
+    # UTF-8 encoded code, shared by every tester that writes the script out
+    code_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if EMIT_PRELUDE not in self.code:
+            object.__setattr__(self, "code", EMIT_PRELUDE + self.code)
+        object.__setattr__(self, "code_bytes", self.code.encode())
+
+
+# Extra seconds granted to sandboxed platforms for sandbox startup on top of
+# the per-test timeout, so startup cost doesn't eat into the test budget. A
+# timeout is reported as TIMEOUT rather than blocked: a slow interpreter start
+# or a loaded host times out just as well as a sandbox does.
+SANDBOX_STARTUP_GRACE = 2
+
+
+def _find_libc() -> Optional[str]:
+    import ctypes.util
+    return ctypes.util.find_library("c")
+
+
+# Host lookups that are expensive in the child (find_library("c") runs
+# ldconfig/gcc on Linux) or that a sandbox may answer differently (HOME).
+# Only values that describe the host filesystem belong here; anything the
+# sandbox itself may change, like hasattr(os, "fork"), must stay inside the
+# test.
+HOST_CONSTANTS = {
+    "LIBC_NAME": _find_libc,
+    # The real user's home is what an attacker would target, even when the
+    # sandbox points $HOME somewhere else
+    "HOME": lambda: os.path.expanduser("~"),
+}
+
+
+def inject_host_constants(
+    tests: Tuple[DetailedSecurityTest, ...]
+) -> Tuple[DetailedSecurityTest, ...]:
+    """Return tests with each requested host constant resolved once and
+    prepended to their code"""
+    resolved: Dict[str, object] = {}
+    injected = []
+    for test in tests:
+        if not test.host_constants:
+            injected.append(test)
+            continue
+        header = []
+        for name in test.host_constants:
+            if name not in resolved:
+                resolved[name] = HOST_CONSTANTS[name]()
+            header.append(f"{name} = {resolved[name]!r}\n")
+        injected.append(replace(test, code="".join(header) + test.code, host_constants=()))
+    return tuple(injected)
+
 
 # ============================================================
 # Detailed security test cases
 # ============================================================
 
-DETAILED_SECURITY_TESTS = [
+DETAILED_SECURITY_TESTS = (
     # ========== os.listdir Test ==========
     DetailedSecurityTest(
         name="listdir_root_detailed",
@@ -91,8 +180,63 @@ except Exception as e:
     result["exception_message"] = str(e)
     result["conclusion"] = "FUNCTION_BLOCKED"
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        timeout=2
+    ),
+    
+    # ========== os.scandir Test ==========
+    DetailedSecurityTest(
+        name="scandir_root_detailed",
+        category="File System",
+        description="os.scandir('/') Detailed Test",
+        code='''
+import json
+import os
+
+result = {
+    "test": "os.scandir('/')",
+    "function_callable": False,
+    "exception_type": None,
+    "exception_message": None,
+    "return_value": None,
+    "file_count": 0,
+    "dir_count": 0,
+    "conclusion": None
+}
+
+try:
+    # Entry type comes from the dirent, so no per-entry stat is needed
+    with os.scandir("/") as it:
+        entries = [(e.name, e.is_dir(follow_symlinks=False)) for e in it]
+    result["function_callable"] = True
+    result["return_value"] = [name for name, _ in entries[:20]]
+    result["file_count"] = len(entries)
+    result["dir_count"] = sum(is_dir for _, is_dir in entries)
+    
+    if len(entries) == 0:
+        result["conclusion"] = "EFFECT_LIMITED"  # Function callable but yields nothing
+    else:
+        result["conclusion"] = "FULLY_ALLOWED"   # Fully succeeded
+        
+except PermissionError as e:
+    result["exception_type"] = "PermissionError"
+    result["exception_message"] = str(e)
+    result["conclusion"] = "FUNCTION_BLOCKED"
+    
+except OSError as e:
+    result["exception_type"] = "OSError"
+    result["exception_message"] = str(e)
+    result["conclusion"] = "FUNCTION_BLOCKED"
+    
+except Exception as e:
+    result["exception_type"] = type(e).__name__
+    result["exception_message"] = str(e)
+    result["conclusion"] = "FUNCTION_BLOCKED"
+
+_emit(result)
+''',
+        timeout=2
     ),
     
     # ========== os.system Test ==========
@@ -118,7 +262,7 @@ result = {
 
 if not result["function_exists"]:
     result["conclusion"] = "FUNCTION_BLOCKED"
-    print(json.dumps(result, indent=2))
+    _emit(result)
     sys.exit(0)
 
 # Test 1: Simple echo command (does not depend on any file reading)
@@ -153,8 +297,9 @@ except Exception as e:
     result["exception_message"] = str(e)
     result["conclusion"] = "FUNCTION_BLOCKED"
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        timeout=2
     ),
     
     # ========== os.system Execute shell command Test ==========
@@ -174,18 +319,21 @@ result = {
 
 # Test 1: Create temporary file (test if shell is actually executing)
 test1 = {
-    "command": "touch /tmp/sandbox_test_file",
+    "command": "touch /tmp/sandbox_test_file_<pid>",
     "success": False,
     "return_code": None,
     "file_created": False
 }
+# Kept under /tmp on purpose: that's the path the sandbox policy is probed on.
+# Per-process name so platforms running concurrently don't race on it.
+scratch_file = f"/tmp/sandbox_test_file_{os.getpid()}"
 try:
-    ret = os.system("touch /tmp/sandbox_test_file_12345 2>/dev/null")
+    ret = os.system(f"touch {scratch_file} 2>/dev/null")
     test1["return_code"] = ret
     test1["success"] = (ret == 0)
-    test1["file_created"] = os.path.exists("/tmp/sandbox_test_file_12345")
+    test1["file_created"] = os.path.exists(scratch_file)
     if test1["file_created"]:
-        os.remove("/tmp/sandbox_test_file_12345")
+        os.remove(scratch_file)
 except Exception as e:
     test1["error"] = str(e)
 result["tests"].append(test1)
@@ -219,18 +367,18 @@ except Exception as e:
 result["tests"].append(test3)
 
 # Summary
-all_blocked = all(not t.get("success", False) for t in result["tests"])
-all_allowed = all(t.get("success", False) for t in result["tests"])
+success_count = sum(1 for t in result["tests"] if t.get("success", False))
 
-if all_blocked:
+if success_count == 0:
     result["conclusion"] = "FUNCTION_BLOCKED"
-elif all_allowed:
+elif success_count == len(result["tests"]):
     result["conclusion"] = "FULLY_ALLOWED"
 else:
     result["conclusion"] = "EFFECT_LIMITED"
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        requires=("os_system_detailed",)
     ),
     
     # ========== subprocess Test ==========
@@ -261,7 +409,7 @@ except ImportError as e:
     result["exception_type"] = "ImportError"
     result["exception_message"] = str(e)
     result["conclusion"] = "FUNCTION_BLOCKED"
-    print(json.dumps(result, indent=2))
+    _emit(result)
     sys.exit(0)
 
 # Test 2: Check if subprocess.run is callable
@@ -333,7 +481,7 @@ elif all(t.get("success", False) for t in result["tests"]):
 else:
     result["conclusion"] = "EFFECT_LIMITED"
 
-print(json.dumps(result, indent=2))
+_emit(result)
 '''
     ),
     
@@ -360,7 +508,7 @@ result = {
 if not result["function_exists"]:
     result["conclusion"] = "FUNCTION_BLOCKED"
     result["exception_message"] = "os.fork not available on this platform"
-    print(json.dumps(result, indent=2))
+    _emit(result)
     sys.exit(0)
 
 try:
@@ -390,8 +538,9 @@ except Exception as e:
     result["exception_message"] = str(e)
     result["conclusion"] = "FUNCTION_BLOCKED"
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        timeout=2
     ),
     
     # ========== File Read Test ==========
@@ -402,29 +551,46 @@ print(json.dumps(result, indent=2))
         code='''
 import json
 import os
+from collections import Counter
 
 result = {
     "test": "sensitive file read",
     "tests": []
 }
 
-sensitive_files = [
+try:
+    HOME  # Resolved once by the harness when available
+except NameError:
+    HOME = os.path.expanduser("~")
+sensitive_files = (
     "/etc/passwd",
     "/etc/shadow",
-    os.path.expanduser("~/.ssh/id_rsa"),
-    os.path.expanduser("~/.bash_history"),
+    f"{HOME}/.ssh/id_rsa",
+    f"{HOME}/.bash_history",
     "/private/etc/passwd",  # macOS
-]
+)
 
 for filepath in sensitive_files:
     test = {
         "file": filepath,
-        "exists": os.path.exists(filepath),
+        "exists": False,
         "readable": False,
         "content_length": 0,
         "exception_type": None,
         "exception_message": None
     }
+
+    # One stat decides existence; a missing file needs no open attempt
+    try:
+        os.stat(filepath)
+        test["exists"] = True
+    except FileNotFoundError as e:
+        test["exception_type"] = "FileNotFoundError"
+        test["exception_message"] = str(e)
+        result["tests"].append(test)
+        continue
+    except OSError:
+        pass
     
     try:
         with open(filepath, "r") as f:
@@ -447,8 +613,12 @@ for filepath in sensitive_files:
     result["tests"].append(test)
 
 # Summary
-readable_count = sum(1 for t in result["tests"] if t["readable"])
-total_existing = sum(1 for t in result["tests"] if t["exists"])
+counts = Counter()
+for t in result["tests"]:
+    counts["readable"] += t["readable"]
+    counts["exists"] += t["exists"]
+readable_count = counts["readable"]
+total_existing = counts["exists"]
 
 if readable_count == 0:
     result["conclusion"] = "FUNCTION_BLOCKED"
@@ -463,8 +633,10 @@ result["summary"] = {
     "readable_files": readable_count
 }
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        timeout=3,
+        host_constants=("HOME",)
     ),
     
     # ========== File Write Test ==========
@@ -476,18 +648,25 @@ print(json.dumps(result, indent=2))
 import json
 import os
 import tempfile
+from collections import Counter
 
 result = {
     "test": "file write",
     "tests": []
 }
 
-write_targets = [
-    "/tmp/sandbox_test_write.txt",
-    "/private/tmp/sandbox_test_write.txt",  # macOS
-    "/etc/sandbox_test_write.txt",  # Should be blocked
-    os.path.expanduser("~/.sandbox_test_write.txt"),
-]
+try:
+    HOME  # Resolved once by the harness when available
+except NameError:
+    HOME = os.path.expanduser("~")
+# Per-process names so platforms running concurrently don't clobber each other
+PID = os.getpid()
+write_targets = (
+    f"/tmp/sandbox_test_write_{PID}.txt",
+    f"/private/tmp/sandbox_test_write_{PID}.txt",  # macOS
+    f"/etc/sandbox_test_write_{PID}.txt",  # Should be blocked
+    f"{HOME}/.sandbox_test_write_{PID}.txt",
+)
 
 for filepath in write_targets:
     test = {
@@ -502,10 +681,9 @@ for filepath in write_targets:
         with open(filepath, "w") as f:
             f.write("sandbox_test_content")
         test["writable"] = True
-        test["file_created"] = os.path.exists(filepath)
+        test["file_created"] = True
         # Cleanup
-        if test["file_created"]:
-            os.remove(filepath)
+        os.remove(filepath)
     except PermissionError as e:
         test["exception_type"] = "PermissionError"
         test["exception_message"] = str(e)
@@ -519,7 +697,10 @@ for filepath in write_targets:
     result["tests"].append(test)
 
 # Summary
-writable_count = sum(1 for t in result["tests"] if t["writable"])
+counts = Counter()
+for t in result["tests"]:
+    counts["writable"] += t["writable"]
+writable_count = counts["writable"]
 
 if writable_count == 0:
     result["conclusion"] = "FUNCTION_BLOCKED"
@@ -533,8 +714,10 @@ result["summary"] = {
     "writable_targets": writable_count
 }
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        timeout=3,
+        host_constants=("HOME",)
     ),
     
     # ========== Network Test ==========
@@ -545,6 +728,7 @@ print(json.dumps(result, indent=2))
         code='''
 import json
 import socket
+from collections import Counter
 
 result = {
     "test": "network access",
@@ -611,14 +795,15 @@ result["tests"].append(test_connect)
 
 # Test 5: Listen on port
 test_listen = {
-    "test": "listen on port 18888",
+    "test": "listen on ephemeral port",
     "success": False,
     "error": None
 }
 try:
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    s.bind(("127.0.0.1", 18888))
+    # Port 0 so concurrent runs on other platforms can't collide
+    s.bind(("127.0.0.1", 0))
     s.listen(1)
     test_listen["success"] = True
     s.close()
@@ -627,7 +812,10 @@ except Exception as e:
 result["tests"].append(test_listen)
 
 # Summary
-success_count = sum(1 for t in result["tests"] if t.get("success", False))
+counts = Counter()
+for t in result["tests"]:
+    counts["success"] += bool(t.get("success"))
+success_count = counts["success"]
 
 if success_count == 0:
     result["conclusion"] = "FUNCTION_BLOCKED"
@@ -641,7 +829,7 @@ result["summary"] = {
     "successful_tests": success_count
 }
 
-print(json.dumps(result, indent=2))
+_emit(result)
 ''',
         timeout=15
     ),
@@ -674,7 +862,7 @@ except ImportError as e:
     result["exception_type"] = "ImportError"
     result["exception_message"] = str(e)
     result["conclusion"] = "FUNCTION_BLOCKED"
-    print(json.dumps(result, indent=2))
+    _emit(result)
     sys.exit(0)
 
 # Test 2: Check if CDLL is accessible
@@ -684,10 +872,13 @@ try:
 except Exception as e:
     result["exception_message"] = str(e)
 
-# Test 3: Load libc
+# Test 3: Load libc (LIBC_NAME is resolved once by the harness when available)
 try:
     import ctypes.util
-    libc_name = ctypes.util.find_library("c")
+    try:
+        libc_name = LIBC_NAME
+    except NameError:
+        libc_name = ctypes.util.find_library("c")
     if libc_name:
         libc = ctypes.CDLL(libc_name)
         result["libc_loadable"] = True
@@ -711,10 +902,220 @@ elif not result["system_callable"]:
 else:
     result["conclusion"] = "FULLY_ALLOWED"
 
-print(json.dumps(result, indent=2))
-'''
+_emit(result)
+''',
+        timeout=3,
+        host_constants=("LIBC_NAME",)
     ),
-]
+)
+
+
+# Result cache: ~/.cache/skilllite-bench/<platform>-<code hash>.json
+RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "skilllite-bench")
+
+
+def _cache_key(test: DetailedSecurityTest) -> str:
+    """Content-addressed key for a test body"""
+    return hashlib.blake2b(test.code_bytes, digest_size=16).hexdigest()
+
+
+def _binary_mtime_ns(binary_path: Optional[str]) -> int:
+    """Modification time of the binary under test; 0 when unknown"""
+    try:
+        return os.stat(binary_path).st_mtime_ns if binary_path else 0
+    except OSError:
+        return 0
+
+
+class ResultCache:
+    """Memoize test results per (platform, test code, binary mtime)
+
+    Results are kept in memory for the current run and persisted to
+    RESULT_CACHE_DIR so a retried benchmark job skips unchanged sandbox runs.
+    Rebuilding or upgrading the binary invalidates its entries. Off unless
+    --cache is given, since results also depend on host network state and
+    sandbox configuration; reused results carry "cached": True.
+    """
+
+    def __init__(self, enabled: bool = False, cache_dir: str = RESULT_CACHE_DIR):
+        self.enabled = enabled
+        self.cache_dir = cache_dir
+        self._memory: Dict[tuple, dict] = {}
+
+    def _path(self, platform: str, key: str) -> str:
+        safe_platform = "".join(c if c.isalnum() else "_" for c in platform)
+        return os.path.join(self.cache_dir, f"{safe_platform}-{key}.json")
+
+    def run(self, platform: str, tester, test: DetailedSecurityTest) -> dict:
+        """Return cached result for test on platform, running it on a miss"""
+        if not self.enabled:
+            return tester.run_test(test)
+
+        binary_path = getattr(tester, "binary_path", None)
+        key = _cache_key(test)
+        mtime_ns = _binary_mtime_ns(binary_path)
+        memo_key = (platform, binary_path, key)
+
+        cached = self._memory.get(memo_key)
+        if cached is not None and cached["mtime_ns"] == mtime_ns:
+            return dict(cached["result"], cached=True)
+
+        path = self._path(platform, key)
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached.get("binary_path") == binary_path and cached.get("mtime_ns") == mtime_ns:
+                self._memory[memo_key] = cached
+                return dict(cached["result"], cached=True)
+        except (OSError, ValueError):
+            pass
+
+        result = tester.run_test(test)
+        # Timeouts and parse failures are often transient; don't pin them
+        if "error" not in result:
+            entry = {"binary_path": binary_path, "mtime_ns": mtime_ns, "result": result}
+            self._memory[memo_key] = entry
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump(entry, f)
+            except OSError:
+                pass
+        return result
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_result(text: str) -> Optional[dict]:
+    """Decode the first JSON object in text, skipping stray '{' in log lines"""
+    json_start = text.find('{')
+    while json_start >= 0:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, json_start)
+            if isinstance(parsed, dict):
+                return parsed
+        except ValueError:
+            pass
+        json_start = text.find('{', json_start + 1)
+    return None
+
+
+def parse_test_output(stdout: bytes, stderr: BinaryIO) -> dict:
+    """Extract the JSON result printed by a test script
+
+    The common case is handled on raw bytes: the payload between the
+    JSON_BEGIN/JSON_END markers is cut out with rpartition/partition and
+    handed to json.loads without decoding, so sandbox log lines around it
+    cost nothing to skip. Falls back to decoding the full stdout and then
+    stderr, which is spooled to a file by the caller and only read back when
+    stdout has no result.
+    """
+    _, begin, framed = stdout.rpartition(JSON_BEGIN)
+    if begin:
+        payload, end, _ = framed.partition(JSON_END)
+        if end:
+            try:
+                parsed = json.loads(payload)
+                if isinstance(parsed, dict) and "conclusion" in parsed:
+                    return parsed
+            except ValueError:
+                pass
+
+    parsed = _decode_result(stdout.decode(errors="replace"))
+    if parsed is not None:
+        return parsed
+
+    stderr.seek(0)
+    stderr_bytes = stderr.read()
+    parsed = _decode_result(stderr_bytes.decode(errors="replace"))
+    if parsed is not None:
+        return parsed
+
+    output = stdout.decode(errors="replace") + stderr_bytes.decode(errors="replace")
+    return {
+        "error": "Failed to parse output",
+        "raw_output": output[:1000],
+        "conclusion": "ERROR"
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _tmp_root() -> Optional[str]:
+    """Prefer tmpfs (/dev/shm) for test fixtures so they never touch disk"""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+_workspace_dir: Optional[str] = None
+
+
+def _workspace() -> str:
+    """Shared scratch root for this run; every tester's work dir lives under it"""
+    global _workspace_dir
+    if _workspace_dir is None:
+        _workspace_dir = tempfile.mkdtemp(prefix="skilllite_bench_", dir=_tmp_root())
+        # On tmpfs this is RAM: remove it on errors and Ctrl-C too
+        atexit.register(_cleanup_workspace)
+    return _workspace_dir
+
+
+def _cleanup_workspace():
+    global _workspace_dir
+    if _workspace_dir is not None:
+        shutil.rmtree(_workspace_dir, ignore_errors=True)
+        _workspace_dir = None
+
+
+# Seconds a child may keep running after reporting its result. Sandbox
+# wrappers (skilllite, srt) tear down their sandbox on exit, so give them a
+# chance to do that before killing them.
+RESULT_EXIT_GRACE = 1.0
+
+
+def run_until_result(cmd: List[str], timeout: float, cwd: Optional[str] = None) -> dict:
+    """Run a test command and parse its framed result
+
+    stdout is read with select() against the deadline as it arrives. Once the
+    JSON_END marker shows up the child gets at most RESULT_EXIT_GRACE seconds
+    to exit and is killed after that, so slow cleanup after the result
+    (socket timeouts, reaping children) doesn't hold up the harness. Raises
+    subprocess.TimeoutExpired if the child neither reports nor exits in time.
+    """
+    deadline = time.monotonic() + timeout
+    with tempfile.TemporaryFile(dir=_tmp_root()) as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, cwd=cwd)
+        fd = proc.stdout.fileno()
+        buf = bytearray()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                ready, _, _ = select.select([fd], [], [], remaining)
+                if not ready:
+                    continue
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    # EOF: the child is exiting on its own
+                    proc.wait(timeout=max(deadline - time.monotonic(), 0))
+                    break
+                buf += chunk
+                # Only the newly read bytes (plus a marker-sized overlap) can hold it
+                if JSON_END in buf[-(len(chunk) + len(JSON_END)):]:
+                    grace = min(RESULT_EXIT_GRACE, max(deadline - time.monotonic(), 0))
+                    try:
+                        proc.wait(timeout=grace)
+                    except subprocess.TimeoutExpired:
+                        pass  # Killed below
+                    break
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        return parse_test_output(bytes(buf), stderr_file)
 
 
 def check_command_available(command: str) -> bool:
@@ -733,6 +1134,9 @@ def check_claude_srt_available() -> bool:
         return False
 
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 def check_skilllite_available(binary_path: str = None) -> tuple:
     """Check if skilllite is available"""
     if binary_path and os.path.exists(binary_path):
@@ -757,14 +1161,20 @@ def check_skilllite_available(binary_path: str = None) -> tuple:
 class DetailedSkillLiteTest:
     """SkillLite detailed security test"""
     
-    def __init__(self, binary_path: str):
+    def __init__(self, binary_path: str,
+                 tests: Tuple[DetailedSecurityTest, ...] = DETAILED_SECURITY_TESTS):
         self.binary_path = os.path.abspath(binary_path)
-        self.work_dir = tempfile.mkdtemp(prefix="skilllite_detailed_")
-        self._setup_test_skill()
+        self.work_dir = os.path.join(_workspace(), "skilllite")
+        os.makedirs(self.work_dir, exist_ok=True)
+        # Prebuild one skill dir per test so run_test does no filesystem writes
+        # and concurrent runs never share main.py
+        self.skill_dirs: Dict[str, str] = {
+            test.name: self._setup_test_skill(test) for test in tests
+        }
     
-    def _setup_test_skill(self):
-        self.skill_dir = os.path.join(self.work_dir, "test-skill")
-        scripts_dir = os.path.join(self.skill_dir, "scripts")
+    def _setup_test_skill(self, test: DetailedSecurityTest) -> str:
+        skill_dir = os.path.join(self.work_dir, test.name)
+        scripts_dir = os.path.join(skill_dir, "scripts")
         os.makedirs(scripts_dir, exist_ok=True)
         
         skill_md = """---
@@ -775,140 +1185,143 @@ entry_point: scripts/main.py
 ---
 # Detailed Security Test Skill
 """
-        with open(os.path.join(self.skill_dir, "SKILL.md"), "w") as f:
+        with open(os.path.join(skill_dir, "SKILL.md"), "w") as f:
             f.write(skill_md)
+        with open(os.path.join(scripts_dir, "main.py"), "wb") as f:
+            f.write(test.code_bytes)
+        return skill_dir
     
     def run_test(self, test: DetailedSecurityTest) -> dict:
         """Run test and return detailed result"""
-        script_path = os.path.join(self.skill_dir, "scripts", "main.py")
-        with open(script_path, "w") as f:
-            f.write(test.code)
+        skill_dir = self.skill_dirs.get(test.name) or self._setup_test_skill(test)
 
         try:
-            result = subprocess.run(
-                [self.binary_path, "run", self.skill_dir, "{}"],
-                capture_output=True,
-                timeout=test.timeout,
+            return run_until_result(
+                [self.binary_path, "run", skill_dir, "{}"],
+                test.timeout + SANDBOX_STARTUP_GRACE,
                 cwd=self.work_dir
             )
-
-            output = result.stdout.decode() + result.stderr.decode()
-
-            # Try to parse JSON output
-            try:
-                # Find JSON section
-                json_start = output.find('{')
-                json_end = output.rfind('}') + 1
-                if json_start >= 0 and json_end > json_start:
-                    json_str = output[json_start:json_end]
-                    return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-            
-            return {
-                "error": "Failed to parse output",
-                "raw_output": output[:1000],
-                "conclusion": "ERROR"
-            }
             
         except subprocess.TimeoutExpired:
-            return {"error": "Timeout", "conclusion": "FUNCTION_BLOCKED"}
+            return {"error": "Timeout", "conclusion": "TIMEOUT"}
         except Exception as e:
             return {"error": str(e), "conclusion": "ERROR"}
-    
-    def cleanup(self):
-        if self.work_dir and os.path.exists(self.work_dir):
-            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+class DetailedSkillLiteIPCTest(DetailedSkillLiteTest):
+    """SkillLite detailed security test through one long-lived daemon
+
+    Sends every test as a JSON-RPC "run" request to `skilllite serve --stdio`
+    instead of spawning the binary per test. Results match the CLI path except
+    that a failed run surfaces as the daemon's error message.
+    """
+
+    def __init__(self, binary_path: str,
+                 tests: Tuple[DetailedSecurityTest, ...] = DETAILED_SECURITY_TESTS):
+        super().__init__(binary_path, tests)
+        sys.path.insert(0, os.path.join(PROJECT_ROOT, "python-sdk"))
+        from skilllite.ipc import IPCClient
+
+        # The daemon only runs skills under SKILLBOX_SKILLS_ROOT; passed to the
+        # daemon alone so the other platforms' runs keep a clean environment
+        self.client = IPCClient(self.binary_path, cwd=self.work_dir,
+                                env={"SKILLBOX_SKILLS_ROOT": self.work_dir})
+        self.client.start()
+
+    def run_test(self, test: DetailedSecurityTest) -> dict:
+        """Run test and return detailed result"""
+        skill_dir = self.skill_dirs.get(test.name) or self._setup_test_skill(test)
+
+        try:
+            res = self.client.run(
+                skill_dir, "{}", timeout=test.timeout + SANDBOX_STARTUP_GRACE
+            )
+            return parse_test_output(res.get("output", "").encode(), io.BytesIO())
+        except queue.Empty:
+            return {"error": "Timeout", "conclusion": "TIMEOUT"}
+        except RuntimeError as e:
+            # Daemon-side failure: treat the message like CLI stderr
+            return parse_test_output(b"", io.BytesIO(str(e).encode()))
+        except Exception as e:
+            return {"error": str(e), "conclusion": "ERROR"}
+
+    def close(self):
+        self.client.close()
 
 
 class DetailedClaudeSRTTest:
     """Claude SRT detailed security test"""
 
     def __init__(self):
-        self.work_dir = tempfile.mkdtemp(prefix="claude_srt_detailed_")
+        self.binary_path = shutil.which("srt")
+        self.work_dir = os.path.join(_workspace(), "claude_srt")
+        os.makedirs(self.work_dir, exist_ok=True)
 
     def run_test(self, test: DetailedSecurityTest) -> dict:
         """Run test and return detailed result"""
-        script_path = os.path.join(self.work_dir, "test_script.py")
-        with open(script_path, "w") as f:
-            f.write(test.code)
+        script_path = os.path.join(self.work_dir, f"{test.name}.py")
+        with open(script_path, "wb") as f:
+            f.write(test.code_bytes)
 
         try:
-            result = subprocess.run(
+            return run_until_result(
                 ["srt", "python3", script_path],
-                capture_output=True,
-                timeout=test.timeout,
+                test.timeout + SANDBOX_STARTUP_GRACE,
                 cwd=self.work_dir
             )
-
-            output = result.stdout.decode() + result.stderr.decode()
-
-            # Try to parse JSON output
-            try:
-                json_start = output.find('{')
-                json_end = output.rfind('}') + 1
-                if json_start >= 0 and json_end > json_start:
-                    json_str = output[json_start:json_end]
-                    return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-            
-            return {
-                "error": "Failed to parse output",
-                "raw_output": output[:1000],
-                "conclusion": "ERROR"
-            }
             
         except subprocess.TimeoutExpired:
-            return {"error": "Timeout", "conclusion": "FUNCTION_BLOCKED"}
+            return {"error": "Timeout", "conclusion": "TIMEOUT"}
         except Exception as e:
             return {"error": str(e), "conclusion": "ERROR"}
-    
-    def cleanup(self):
-        if self.work_dir and os.path.exists(self.work_dir):
-            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+# Runs a marshaled code object so the child skips parsing and compiling
+_MARSHAL_DRIVER = "import marshal,sys; exec(marshal.load(open(sys.argv[1], 'rb')))"
 
 
 class DetailedNativePythonTest:
     """Native Python detailed security test (as baseline)"""
 
+    def __init__(self, tests: Tuple[DetailedSecurityTest, ...] = DETAILED_SECURITY_TESTS):
+        self.binary_path = sys.executable
+        # The child is this same interpreter, so its marshal format matches
+        self.work_dir = os.path.join(_workspace(), "native")
+        os.makedirs(self.work_dir, exist_ok=True)
+        self.code_paths: Dict[str, str] = {}
+        for test in tests:
+            code_path = os.path.join(self.work_dir, f"{test.name}.marshal")
+            with open(code_path, "wb") as f:
+                marshal.dump(compile(test.code, test.name, "exec"), f)
+            self.code_paths[test.name] = code_path
+
+    def _command(self, test: DetailedSecurityTest) -> List[str]:
+        code_path = self.code_paths.get(test.name)
+        if code_path is None:
+            return [sys.executable, "-c", test.code]
+        return [sys.executable, "-c", _MARSHAL_DRIVER, code_path]
+
     def run_test(self, test: DetailedSecurityTest) -> dict:
         """Run test and return detailed result"""
         try:
-            result = subprocess.run(
-                [sys.executable, "-c", test.code],
-                capture_output=True,
-                timeout=test.timeout
+            return run_until_result(
+                self._command(test),
+                test.timeout
             )
             
-            output = result.stdout.decode() + result.stderr.decode()
-            
-            try:
-                json_start = output.find('{')
-                json_end = output.rfind('}') + 1
-                if json_start >= 0 and json_end > json_start:
-                    json_str = output[json_start:json_end]
-                    return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-            
-            return {
-                "error": "Failed to parse output",
-                "raw_output": output[:1000],
-                "conclusion": "ERROR"
-            }
-            
         except subprocess.TimeoutExpired:
-            return {"error": "Timeout", "conclusion": "FUNCTION_BLOCKED"}
+            return {"error": "Timeout", "conclusion": "TIMEOUT"}
         except Exception as e:
             return {"error": str(e), "conclusion": "ERROR"}
 
 
-def print_detailed_results(results: Dict[str, Dict[str, dict]], platforms: List[str]):
+def print_detailed_results(results: Dict[str, Dict[str, dict]], platforms: List[str],
+                           tests: Tuple[DetailedSecurityTest, ...] = DETAILED_SECURITY_TESTS):
     """Print detailed results table"""
-    print("\n" + "=" * 100)
-    print("Detailed Security Test Results")
-    print("=" * 100)
+    lines: List[str] = []
+    lines.append("\n" + "=" * 100)
+    lines.append("Detailed Security Test Results")
+    lines.append("=" * 100)
 
     # Conclusion mapping
     conclusion_display = {
@@ -916,11 +1329,12 @@ def print_detailed_results(results: Dict[str, Dict[str, dict]], platforms: List[
         "EFFECT_LIMITED": "🛡️ Effect Limited",
         "FULLY_ALLOWED": "❌ Fully Allowed",
         "ERROR": "⚙️ Error",
+        "TIMEOUT": "⏱️ Timeout (inconclusive)",
     }
     
-    for test in DETAILED_SECURITY_TESTS:
-        print(f"\n### {test.description} ({test.name})")
-        print("-" * 80)
+    for test in tests:
+        lines.append(f"\n### {test.description} ({test.name})")
+        lines.append("-" * 80)
         
         for platform in platforms:
             if platform in results and test.name in results[platform]:
@@ -928,7 +1342,8 @@ def print_detailed_results(results: Dict[str, Dict[str, dict]], platforms: List[
                 conclusion = result.get("conclusion", "ERROR")
                 display = conclusion_display.get(conclusion, conclusion)
                 
-                print(f"\n**{platform}**: {display}")
+                cached = " (cached)" if result.get("cached") else ""
+                lines.append(f"\n**{platform}**: {display}{cached}")
 
                 # Print detailed information
                 if "tests" in result:
@@ -938,18 +1353,36 @@ def print_detailed_results(results: Dict[str, Dict[str, dict]], platforms: List[
                             success = t.get("success", t.get("readable", t.get("writable", False)))
                             error = t.get("error", t.get("exception_message", ""))
                             status = "✅" if success else "❌"
-                            print(f"  {status} {test_name}")
+                            lines.append(f"  {status} {test_name}")
                             if error:
-                                print(f"      Error: {error[:80]}")
+                                lines.append(f"      Error: {error[:80]}")
                 
+                if result.get("skipped"):
+                    lines.append(f"  Skipped: prerequisite blocked ({', '.join(result['blocked_by'])})")
+
                 if "summary" in result:
-                    print(f"  Summary: {result['summary']}")
+                    lines.append(f"  Summary: {result['summary']}")
                 
                 if "exception_type" in result and result["exception_type"]:
-                    print(f"  Exception: {result['exception_type']}: {result.get('exception_message', '')[:80]}")
+                    lines.append(f"  Exception: {result['exception_type']}: {result.get('exception_message', '')[:80]}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SkillLite Detailed Security Benchmark")
+    parser.add_argument("--cache", action="store_true",
+                        help=f"Reuse results cached in {RESULT_CACHE_DIR} instead of rerunning tests")
+    parser.add_argument("--ipc", action="store_true",
+                        help="Run SkillLite tests through one `skilllite serve --stdio` daemon")
+    args = parser.parse_args()
+
+    tests = inject_host_constants(DETAILED_SECURITY_TESTS)
+    cache = ResultCache(enabled=args.cache)
+
     print("=" * 100)
     print("SkillLite Detailed Security Benchmark")
     print("=" * 100)
@@ -960,7 +1393,7 @@ def main():
 
     # Native Python (as baseline)
     platforms.append("Native Python")
-    testers["Native Python"] = DetailedNativePythonTest()
+    testers["Native Python"] = DetailedNativePythonTest(tests)
 
     # Claude SRT
     if check_claude_srt_available():
@@ -972,45 +1405,86 @@ def main():
 
     # SkillLite
     skilllite_available, skilllite_path = check_skilllite_available()
-    if skilllite_available:
+    if skilllite_available and args.ipc:
+        platforms.append("SkillLite (IPC)")
+        testers["SkillLite (IPC)"] = tester = DetailedSkillLiteIPCTest(skilllite_path, tests)
+        # Runs on normal exit, errors and Ctrl-C alike
+        atexit.register(tester.close)
+        print(f"✅ SkillLite available: {skilllite_path} (IPC daemon)")
+    elif skilllite_available:
         platforms.append("SkillLite")
-        testers["SkillLite"] = DetailedSkillLiteTest(skilllite_path)
+        testers["SkillLite"] = DetailedSkillLiteTest(skilllite_path, tests)
         print(f"✅ SkillLite available: {skilllite_path}")
     else:
         print("⚠️ SkillLite not available, skipping")
 
     print(f"\nTest platforms: {', '.join(platforms)}")
-    print(f"Test cases: {len(DETAILED_SECURITY_TESTS)}")
+    print(f"Test cases: {len(tests)}")
 
-    # Run tests
+    # Run tests; every (platform, test) pair is an independent subprocess,
+    # so dispatch them all at once and collect results as they finish. Tests
+    # with prerequisites are dispatched once those have finished, or skipped
+    # when a prerequisite was blocked on that platform.
     results = {platform: {} for platform in platforms}
-
-    for test in DETAILED_SECURITY_TESTS:
-        print(f"\nRunning test: {test.description}...")
-        
-        for platform in platforms:
-            tester = testers[platform]
-            result = tester.run_test(test)
+    dependents: Dict[str, List[DetailedSecurityTest]] = {}
+    for test in tests:
+        for required in test.requires:
+            dependents.setdefault(required, []).append(test)
+    total_runs = len(tests) * len(platforms)
+
+    print(f"\nRunning {total_runs} test runs...")
+    with ThreadPoolExecutor(max_workers=min(32, total_runs)) as executor:
+        futures = {}
+
+        def submit(platform: str, test: DetailedSecurityTest):
+            future = executor.submit(cache.run, platform, testers[platform], test)
+            futures[future] = (platform, test)
+
+        def record(platform: str, test: DetailedSecurityTest, result: dict):
+            # Only this thread writes results, so no lock is needed
             results[platform][test.name] = result
-            
             conclusion = result.get("conclusion", "ERROR")
-            print(f"  {platform}: {conclusion}")
+            cached = " (cached)" if result.get("cached") else ""
+            print(f"  {platform} / {test.description}: {conclusion}{cached}")
+
+            for dependent in dependents.get(test.name, ()):
+                if not all(name in results[platform] for name in dependent.requires):
+                    continue
+                blocked_by = [
+                    name for name in dependent.requires
+                    if results[platform][name].get("conclusion") == "FUNCTION_BLOCKED"
+                ]
+                if blocked_by:
+                    record(platform, dependent, {
+                        "conclusion": "FUNCTION_BLOCKED",
+                        "skipped": True,
+                        "blocked_by": blocked_by,
+                    })
+                else:
+                    submit(platform, dependent)
+
+        for test in tests:
+            if not test.requires:
+                for platform in platforms:
+                    submit(platform, test)
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                platform, test = futures.pop(future)
+                record(platform, test, future.result())
     
     # Print detailed results
-    print_detailed_results(results, platforms)
-
-    # Cleanup
-    for platform, tester in testers.items():
-        if hasattr(tester, "cleanup"):
-            tester.cleanup()
+    print_detailed_results(results, platforms, tests)
 
     # Print comparison summary
-    print("\n" + "=" * 100)
-    print("Comparison Summary")
-    print("=" * 100)
+    lines: List[str] = []
+    lines.append("\n" + "=" * 100)
+    lines.append("Comparison Summary")
+    lines.append("=" * 100)
 
     summary_table = []
-    for test in DETAILED_SECURITY_TESTS:
+    for test in tests:
         row = {"test": test.description}
         for platform in platforms:
             if platform in results and test.name in results[platform]:
@@ -1023,14 +1497,15 @@ def main():
     header = f"| {'Test Item'.ljust(35)} |"
     for platform in platforms:
         header += f" {platform.center(18)} |"
-    print(header)
-    print("|" + "-" * 37 + "|" + ("|" + "-" * 20) * len(platforms))
+    lines.append(header)
+    lines.append("|" + "-" * 37 + "|" + ("|" + "-" * 20) * len(platforms))
     
     conclusion_short = {
         "FUNCTION_BLOCKED": "🔒 Blocked",
         "EFFECT_LIMITED": "🛡️ Limited",
         "FULLY_ALLOWED": "❌ Allowed",
         "ERROR": "⚙️ Error",
+        "TIMEOUT": "⏱️ Timeout",
         "SKIPPED": "⏭️ Skipped",
     }
     
@@ -1040,7 +1515,10 @@ def main():
             val = row.get(platform, "SKIPPED")
             display = conclusion_short.get(val, val)
             line += f" {display.center(18)} |"
-        print(line)
+        lines.append(line)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
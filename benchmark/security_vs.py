@@ -21,13 +21,32 @@ Level 3: Sandbox isolation + static code scanning
 
 import subprocess
 import os
+import time
 import tempfile
 import shutil
+import atexit
+import functools
+import hashlib
+import importlib.util
 import json
+import marshal
+import queue
+import select
+import signal
 import sys
-from dataclasses import dataclass
+import threading
+import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, List, Optional, Set, Tuple
+
+# Optional: faster encoding of --jsonl records
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class SecurityResult(Enum):
@@ -39,19 +58,28 @@ class SecurityResult(Enum):
     SKIPPED = "⏭️ Skipped"     # Test skipped
 
 
-@dataclass
+# What every test prints when its attack got through
+SUCCESS_INDICATOR = '"result": "SUCCESS"'
+
+
+@dataclass(frozen=True, slots=True)
 class SecurityTest:
-    """Security test case"""
+    """Security test case (immutable, so worker threads can share it)"""
     name: str
     category: str
     description: str
     code: str
-    success_indicator: str  # If output contains this string, attack succeeded
     timeout: int = 10
+    success_indicator: str = SUCCESS_INDICATOR  # If output contains this string, attack succeeded
+    # success_indicator encoded once, for matching raw child output
+    success_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "success_bytes", self.success_indicator.encode())
 
 
 # Security test case definitions
-SECURITY_TESTS = [
+SECURITY_TESTS: Tuple[SecurityTest, ...] = (
     # ========== File System Isolation ==========
     SecurityTest(
         name="read_etc_passwd",
@@ -66,7 +94,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -84,7 +111,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -100,7 +126,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -119,7 +144,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -135,7 +159,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     # ========== Network Isolation ==========
@@ -152,7 +175,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"',
         timeout=8
     ),
     
@@ -169,7 +191,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"',
         timeout=10
     ),
     
@@ -182,14 +203,14 @@ import json
 try:
     import socket
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.bind(("0.0.0.0", 8888))
+    # Port 0 so platforms running concurrently can't collide on a fixed port
+    s.bind(("0.0.0.0", 0))
     s.listen(1)
     s.close()
     print(json.dumps({"result": "SUCCESS"}))
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     # ========== Process Isolation ==========
@@ -206,7 +227,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -222,7 +242,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -239,7 +258,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -261,7 +279,6 @@ except ProcessLookupError:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     # ========== Resource Limits ==========
@@ -280,7 +297,6 @@ except MemoryError:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"',
         timeout=10
     ),
     
@@ -302,7 +318,6 @@ except AttributeError:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -328,7 +343,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"',
         timeout=8  # Shortened timeout for faster testing
     ),
     
@@ -346,7 +360,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -361,7 +374,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -380,7 +392,6 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     # ========== Information Leakage ==========
@@ -391,14 +402,15 @@ except Exception as e:
         code='''
 import json
 import os
+import re
 try:
     env_vars = dict(os.environ)
-    sensitive_keys = [k for k in env_vars if any(s in k.upper() for s in ["KEY", "SECRET", "TOKEN", "PASSWORD", "CREDENTIAL"])]
+    sensitive = re.compile(r"(?i)KEY|SECRET|TOKEN|PASSWORD|CREDENTIAL")
+    sensitive_keys = [k for k in env_vars if sensitive.search(k)]
     print(json.dumps({"result": "SUCCESS", "env_count": len(env_vars), "sensitive_keys": sensitive_keys}))
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
     
     SecurityTest(
@@ -421,55 +433,140 @@ try:
 except Exception as e:
     print(json.dumps({"result": "BLOCKED", "error": str(e)}))
 ''',
-        success_indicator='"result": "SUCCESS"'
     ),
-]
+)
+
+
+# Output markers, matched against raw child output so results are classified
+# without decoding it first (see also SecurityTest.success_bytes)
+PARTIAL_MARKER = b'"result": "PARTIAL"'
+BLOCKED_MARKER = b'"result": "BLOCKED"'
 
 
+def classify_output(test: SecurityTest, output: bytes) -> SecurityResult:
+    """Map a run's combined raw output to a SecurityResult
+
+    A success indicator anywhere beats a PARTIAL report, so these stay two
+    memmem-backed `in` scans rather than one regex alternation, which would
+    stop at whichever marker comes first. Anything else is a block, whether
+    the test reported BLOCKED, the sandbox denied it or the run failed;
+    telling those apart wouldn't change the result.
+    """
+    if test.success_bytes in output:
+        return SecurityResult.ALLOWED
+    elif PARTIAL_MARKER in output:
+        return SecurityResult.PARTIAL
+    return SecurityResult.BLOCKED
+
+
+def timed_out(tester, test: SecurityTest) -> SecurityResult:
+    """Result for a run that hit its timeout: scored as blocked
+
+    The test is also recorded in tester.timed_out so ResultCache doesn't
+    keep it; a loaded host or a slow network times out as well as a sandbox.
+    """
+    tester.timed_out.add(test.name)
+    return SecurityResult.BLOCKED
+
+
+@functools.lru_cache(maxsize=None)
 def check_command_available(command: str) -> bool:
     """Check if a command is available"""
     return shutil.which(command) is not None
 
-def check_claude_srt_available() -> bool:
-    """Check if Claude SRT (Sandboxed Runtime) is available"""
-    if not check_command_available("srt"):
-        return False
+
+# Successful runtime probes: ~/.cache/skilllite-bench/runners.json, keyed by
+# probe name and invalidated when the binary changes or the entry ages out
+PROBE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "skilllite-bench", "runners.json")
+PROBE_CACHE_TTL = 3600
+# A healthy --version answers in well under a second; slower is itself a problem
+PROBE_TIMEOUT = 2
+
+
+def _cached_probe(name: str, binary_path: str, probe) -> bool:
+    """Return probe(), or True if it recently succeeded for this exact binary"""
     try:
-        result = subprocess.run(
-            ["srt", "--version"],
-            capture_output=True,
-            timeout=10
-        )
+        mtime_ns = os.stat(binary_path).st_mtime_ns
+    except OSError:
+        return probe()
+
+    try:
+        with open(PROBE_CACHE_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    entry = manifest.get(name) if isinstance(manifest, dict) else None
+    if (isinstance(entry, dict)
+            and entry.get("path") == binary_path
+            and entry.get("mtime_ns") == mtime_ns
+            and time.time() - entry.get("ts", 0) < PROBE_CACHE_TTL):
+        return True
+
+    ok = probe()
+    # Failures aren't cached: a stopped daemon may be started before the next run
+    if ok:
+        manifest = manifest if isinstance(manifest, dict) else {}
+        manifest[name] = {"path": binary_path, "mtime_ns": mtime_ns, "ts": time.time()}
+        try:
+            os.makedirs(os.path.dirname(PROBE_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{PROBE_CACHE_PATH}.{os.getpid()}"
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, PROBE_CACHE_PATH)
+        except OSError:
+            pass
+    return ok
+
+
+def _probe_command(cmd: list) -> bool:
+    """Whether cmd exits 0 within PROBE_TIMEOUT"""
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=PROBE_TIMEOUT)
         return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def check_claude_srt_available() -> bool:
+    """Check if Claude SRT (Sandboxed Runtime) is available"""
+    srt_path = shutil.which("srt")
+    if not srt_path:
         return False
+    return _cached_probe("srt", srt_path, lambda: _probe_command(["srt", "--version"]))
 
 
+@functools.lru_cache(maxsize=1)
 def check_docker_available() -> bool:
     """Check if Docker is available"""
-    if not check_command_available("docker"):
-        return False
-    try:
-        result = subprocess.run(
-            ["docker", "version"],
-            capture_output=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    docker_path = shutil.which("docker")
+    if not docker_path:
         return False
+    # `docker version` rather than `docker -v`: it fails when the daemon is
+    # down, which would otherwise make every test look BLOCKED
+    return _cached_probe("docker", docker_path, lambda: _probe_command(["docker", "version"]))
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_skilllite(binary_path: str) -> bool:
+    """Whether the skilllite binary at binary_path launches"""
+    # Any exit status counts: this only checks that the binary launches
+    def probe():
+        try:
+            subprocess.run([binary_path, "--help"], capture_output=True, timeout=PROBE_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    return _cached_probe("skilllite", binary_path, probe)
 
 
 def check_skilllite_available(binary_path: str = None) -> tuple:
     """Check if skilllite binary is available, returns (is_available, actual_path)
     Binary lives in skilllite/ directory (not skillbox). Fallback to skillbox for backward compat.
     """
-    if binary_path and os.path.exists(binary_path):
-        try:
-            subprocess.run([binary_path, "--help"], capture_output=True, timeout=10)
-            return True, binary_path
-        except Exception:
-            pass
+    if binary_path and os.path.exists(binary_path) and _probe_skilllite(os.path.abspath(binary_path)):
+        return True, binary_path
 
     # Primary: skilllite (current project structure)
     for name in ("skilllite", "skillbox"):
@@ -494,20 +591,186 @@ def check_skilllite_available(binary_path: str = None) -> tuple:
     return False, ""
 
 
+def _binary_mtime_ns(path: Optional[str]) -> int:
+    """Modification time of a sandbox binary or package file; 0 when unknown"""
+    try:
+        return os.stat(path).st_mtime_ns if path else 0
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=None)
+def _which(command: str) -> str:
+    """Absolute path of command, resolved once per run"""
+    return shutil.which(command) or command
+
+
+@functools.lru_cache(maxsize=None)
+def _tmp_root() -> Optional[str]:
+    """Prefer tmpfs (/dev/shm) for test fixtures so they never touch disk"""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def _shm_mkdtemp(prefix: str) -> str:
+    """tempfile.mkdtemp() on tmpfs when available, else the default temp dir"""
+    return tempfile.mkdtemp(prefix=prefix, dir=_tmp_root())
+
+
+def _write_file(path: str, data: bytes):
+    """Write data to path with one raw open/write, skipping Python's file object layers"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Output kept per test run; a child that writes more is killed at this point
+MAX_OUTPUT_BYTES = 64 * 1024
+
+
+def _kill_process_group(pgid: int):
+    """SIGKILL every process left in group pgid, if any"""
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _run_bounded(cmd: list, timeout: float, max_bytes: int = MAX_OUTPUT_BYTES,
+                 kill_group: bool = False, stop_markers: Tuple[bytes, ...] = (),
+                 **kwargs) -> subprocess.CompletedProcess:
+    """subprocess.run(capture_output=True) that keeps at most max_bytes of output
+
+    stdout and stderr are read with select() against the deadline. Once the
+    child has written max_bytes between them it is killed, so a broken sandbox
+    flooding output can't grow the harness's memory without bound. Raises
+    subprocess.TimeoutExpired like subprocess.run.
+
+    With kill_group the child leads its own process group, and the whole group
+    is killed when the run ends, so descendants it left behind (fork bomb
+    survivors, busy loops in grandchildren) can't steal CPU from later tests.
+
+    Once a stdout line starts with any of stop_markers the child is killed as
+    well, so a run that has already reported its result doesn't hold the
+    worker while the sandbox winds down.
+    """
+    deadline = time.monotonic() + timeout
+    # An absolute executable and close_fds=False let subprocess use
+    # posix_spawn() when no cwd or new session is requested (the Docker calls);
+    # the rest still take CPython's vfork() path on Linux. Leaving fds open is safe: Python
+    # creates its pipes and files non-inheritable (PEP 446)
+    proc = subprocess.Popen(
+        cmd,
+        executable=_which(cmd[0]),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+        start_new_session=kill_group,
+        **kwargs
+    )
+    out_fd, err_fd = proc.stdout.fileno(), proc.stderr.fileno()
+    buffers = {out_fd: bytearray(), err_fd: bytearray()}
+    open_fds = [out_fd, err_fd]
+    total = 0
+    # Matched at line starts; a marker may straddle two reads, so each scan
+    # starts this far back
+    line_markers = [b"\n" + marker for marker in stop_markers]
+    overlap = max(map(len, line_markers), default=1) - 1
+    stopped = False
+    try:
+        while open_fds and total < max_bytes and not stopped:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            ready, _, _ = select.select(open_fds, [], [], remaining)
+            for fd in ready:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    open_fds.remove(fd)
+                    continue
+                chunk = chunk[:max_bytes - total]
+                buffers[fd] += chunk
+                total += len(chunk)
+                if fd == out_fd and stop_markers:
+                    stdout = buffers[out_fd]
+                    recent = stdout[max(len(stdout) - len(chunk) - overlap, 0):]
+                    stopped = (any(marker in recent for marker in line_markers)
+                               or stdout.startswith(stop_markers))
+        if not stopped and total < max_bytes:
+            # Both pipes hit EOF: the child is exiting on its own
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+        if kill_group:
+            _kill_process_group(proc.pid)
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    return subprocess.CompletedProcess(cmd, proc.returncode, bytes(buffers[out_fd]), bytes(buffers[err_fd]))
+
+
+def result_markers(test: SecurityTest) -> Tuple[bytes, ...]:
+    """Starts of the result line every test prints exactly once
+
+    Nothing the run prints after it can change classify_output()'s answer,
+    so runs are stopped there (see _run_bounded's stop_markers). Only whole
+    lines count: a Level 3 scan report quoting the test's source contains
+    the same markers mid-line.
+    """
+    return tuple(b"{" + marker for marker in (test.success_bytes, PARTIAL_MARKER, BLOCKED_MARKER))
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 class SkillLiteSecurityTest:
     """SkillLite security test (Rust sandbox executor in skilllite/ directory)"""
+
+    # (work_dir, skill_dirs) shared by every level's tester: skilllite only
+    # reads the skills, so one tree is written per run instead of per level
+    _shared_tree: Optional[Tuple[str, dict]] = None
     
     def __init__(self, binary_path: str, sandbox_level: int = 2):
         # Convert to absolute path to avoid issues when running from different directories
         self.binary_path = os.path.abspath(binary_path)
         self.sandbox_level = sandbox_level
-        self.work_dir = tempfile.mkdtemp(prefix="skilllite_security_")
-        self._setup_test_skill()
+        self.timed_out: Set[str] = set()
+        if SkillLiteSecurityTest._shared_tree is None:
+            self.work_dir = _shm_mkdtemp("skilllite_security_")
+            self.skill_dirs = self._setup_test_skill_batch(SECURITY_TESTS)
+            SkillLiteSecurityTest._shared_tree = (self.work_dir, self.skill_dirs)
+        else:
+            self.work_dir, self.skill_dirs = SkillLiteSecurityTest._shared_tree
+        # Set environment variables for skilllite (SKILLBOX_* for backward compat),
+        # built once rather than copying os.environ per test
+        self.env = {
+            **os.environ,
+            # Use specified sandbox level
+            "SKILLBOX_SANDBOX_LEVEL": str(sandbox_level),
+            "SKILLLITE_TRUST_BYPASS_CONFIRM": "1",
+            # Flush partial output before a kill, like `python -u` elsewhere
+            "PYTHONUNBUFFERED": "1",
+        }
+        # Everything before the per-test skill dir and input
+        self.cmd_prefix = (self.binary_path, "run", "--sandbox-level", str(sandbox_level))
+
+    def _setup_test_skill_batch(self, tests) -> dict:
+        """Build every test's skill dir up front, keyed by test name"""
+        return {test.name: self._setup_test_skill(test) for test in tests}
     
-    def _setup_test_skill(self):
-        """Create Skill directory structure for testing"""
-        self.skill_dir = os.path.join(self.work_dir, "test-skill")
-        scripts_dir = os.path.join(self.skill_dir, "scripts")
+    def _setup_test_skill(self, test: SecurityTest) -> str:
+        """Create Skill directory structure for testing
+
+        Each test gets its own skill dir so concurrent runs never share main.py.
+        """
+        skill_dir = os.path.join(self.work_dir, test.name)
+        scripts_dir = os.path.join(skill_dir, "scripts")
         os.makedirs(scripts_dir, exist_ok=True)
         
         skill_md = """---
@@ -518,117 +781,459 @@ entry_point: scripts/main.py
 ---
 # Security Test Skill
 """
-        with open(os.path.join(self.skill_dir, "SKILL.md"), "w") as f:
-            f.write(skill_md)
+        _write_file(os.path.join(skill_dir, "SKILL.md"), skill_md.encode())
+        _write_file(os.path.join(scripts_dir, "main.py"), test.code.encode())
+        return skill_dir
     
     def run_test(self, test: SecurityTest) -> SecurityResult:
         """Run a single security test"""
-        script_path = os.path.join(self.skill_dir, "scripts", "main.py")
-        with open(script_path, "w") as f:
-            f.write(test.code)
+        skill_dir = self.skill_dirs.get(test.name) or self._setup_test_skill(test)
         
         try:
-            # Set environment variables for skilllite (SKILLBOX_* for backward compat)
-            # Use specified sandbox level
-            env = os.environ.copy()
-            env["SKILLBOX_SANDBOX_LEVEL"] = str(self.sandbox_level)
-            env["SKILLLITE_TRUST_BYPASS_CONFIRM"] = "1"
-            
-            result = subprocess.run(
-                [self.binary_path, "run", "--sandbox-level", str(self.sandbox_level), self.skill_dir, "{}"],
-                capture_output=True,
-                timeout=test.timeout,
+            result = _run_bounded(
+                [*self.cmd_prefix, skill_dir, "{}"],
+                test.timeout,
+                kill_group=True,
+                stop_markers=result_markers(test),
                 cwd=self.work_dir,
-                env=env
+                env=self.env
             )
             
-            output = result.stdout.decode() + result.stderr.decode()
-            
-            # Check if the attack succeeded
-            if test.success_indicator in output:
-                return SecurityResult.ALLOWED
-            elif '"result": "PARTIAL"' in output:
-                return SecurityResult.PARTIAL
-            # Check if blocked by Skillbox security wrapper
-            elif "[SKILLBOX]" in output and "denied" in output.lower():
-                return SecurityResult.BLOCKED
-            elif '"result": "BLOCKED"' in output:
-                return SecurityResult.BLOCKED
-            # If skill execution failed with error, check if it's a security block
-            elif result.returncode != 0:
-                # Check stderr for security-related errors
-                if "SKILLBOX" in output or "SecurityError" in output or "denied" in output.lower():
-                    return SecurityResult.BLOCKED
-                # Other errors might still be security blocks
-                if "Permission" in output or "access" in output.lower():
-                    return SecurityResult.BLOCKED
-                return SecurityResult.BLOCKED  # Treat execution failures as blocked
-            else:
-                return SecurityResult.BLOCKED
+            return classify_output(test, result.stdout + result.stderr)
                 
         except subprocess.TimeoutExpired:
-            return SecurityResult.BLOCKED  # Timeout is treated as blocked
+            return timed_out(self, test)
         except Exception as e:
             return SecurityResult.ERROR
     
+    def cache_key(self) -> str:
+        """Identifies the sandbox build; cached results only count while it matches"""
+        return f"{self.binary_path}:{_binary_mtime_ns(self.binary_path)}"
+
     def cleanup(self):
-        """Clean up temporary directory"""
+        """Clean up temporary directory (the shared skill tree, for every level)"""
+        if SkillLiteSecurityTest._shared_tree and SkillLiteSecurityTest._shared_tree[0] == self.work_dir:
+            SkillLiteSecurityTest._shared_tree = None
         if self.work_dir and os.path.exists(self.work_dir):
             shutil.rmtree(self.work_dir, ignore_errors=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _ipc_client_class():
+    """IPCClient from the in-repo python-sdk, put on sys.path once per process"""
+    sdk_dir = os.path.join(PROJECT_ROOT, "python-sdk")
+    if sdk_dir not in sys.path:
+        sys.path.insert(0, sdk_dir)
+    from skilllite.ipc import IPCClient
+    return IPCClient
+
+
+class SkillLiteIPCSecurityTest(SkillLiteSecurityTest):
+    """SkillLite security test through one long-lived daemon
+
+    Sends every test as a JSON-RPC "run" request to `skilllite serve --stdio`
+    instead of spawning the binary per test, so binary startup is paid once.
+    Falls back to per-test CLI runs if the daemon can't be started.
+    """
+
+    def __init__(self, binary_path: str, sandbox_level: int = 2):
+        super().__init__(binary_path, sandbox_level)
+        IPCClient = _ipc_client_class()
+
+        # The daemon only runs skills under SKILLBOX_SKILLS_ROOT, and needs
+        # the same trust bypass the CLI path sets per run. Passed to the daemon
+        # alone: other platforms' runs share this process's environment
+        self.client = IPCClient(self.binary_path, cwd=self.work_dir, env={
+            "SKILLBOX_SKILLS_ROOT": self.work_dir,
+            "SKILLLITE_TRUST_BYPASS_CONFIRM": "1",
+        })
+        try:
+            self.client.start()
+        except OSError as e:
+            print(f"  [SkillLite IPC] Daemon failed to start ({e}), using CLI runs", file=sys.stderr)
+            self.client = None
+
+    def run_test(self, test: SecurityTest) -> SecurityResult:
+        """Run a single security test"""
+        if self.client is None or not self.client.is_running():
+            # No daemon, or it died: fall back to one CLI run per test
+            return super().run_test(test)
+
+        skill_dir = self.skill_dirs.get(test.name) or self._setup_test_skill(test)
+        try:
+            res = self.client.run(skill_dir, "{}", sandbox_level=self.sandbox_level,
+                                  timeout=test.timeout)
+            return classify_output(test, res.get("output", "").encode())
+        except queue.Empty:
+            return timed_out(self, test)
+        except RuntimeError as e:
+            # Daemon-side failure: treat the message like CLI stderr of a failed run
+            return classify_output(test, str(e).encode())
+        except Exception:
+            return SecurityResult.ERROR
+
+    def cleanup(self):
+        """Stop the daemon and clean up temporary directory"""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+        super().cleanup()
+
+
+# Runs inside the shared container: reads [{name, code, timeout}, ...] as JSON
+# on stdin, runs the tests one after another, each in its own python process
+# (own session, killed with its children on timeout), and prints one JSON line
+# per test. Serial so timing-bound tests don't compete with their siblings and
+# process_list sees what an isolated `docker run` would
+DOCKER_BATCH_DRIVER = f"""
+import json, os, signal, subprocess, sys
+
+def run(test):
+    proc = subprocess.Popen([sys.executable, "-u", "-c", test["code"]], stdin=subprocess.DEVNULL,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True)
+    try:
+        stdout, stderr = proc.communicate(timeout=test["timeout"])
+        timed_out = False
+    except subprocess.TimeoutExpired:
+        os.killpg(proc.pid, signal.SIGKILL)
+        stdout, stderr = proc.communicate()
+        timed_out = True
+    output = (stdout + stderr)[:{MAX_OUTPUT_BYTES}]
+    return {{"name": test["name"], "output": output.decode("utf-8", "replace"), "timed_out": timed_out}}
+
+for test in json.load(sys.stdin):
+    print(json.dumps(run(test)), flush=True)
+"""
+
+
 class DockerSecurityTest:
-    """Docker security test"""
+    """Docker security test
+
+    Tests run via `docker exec` in one long-lived container, so container
+    startup is paid once instead of per test. Tests that could leave that
+    container degraded get a fresh `docker run --rm` container instead, as
+    does everything if the shared container can't be started.
+    """
+
+    # The Docker daemon serializes container creation, so more concurrent
+    # `docker run`s than this only queue up inside dockerd
+    MAX_CONCURRENT_CONTAINERS = 4
+
+    # An OOM kill or leftover children would affect every later test in a
+    # shared container
+    FRESH_CONTAINER_TESTS = {"memory_bomb", "fork_bomb"}
+
+    # Shared-container tests go through one `docker exec` of
+    # DOCKER_BATCH_DRIVER, so main() submits the platform as one run_tests()
+    BATCH = True
     
     def __init__(self, image: str = "python:3.11-slim"):
         self.image = image
+        self.timed_out: Set[str] = set()
+        self._image_id: Optional[str] = None
+        self._slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_CONTAINERS)
+        self._container_lock = threading.Lock()
+        self._container_id: Optional[str] = None
+        self._container_failed = False
+        # Pull the image while other platforms' tests run; a cold pull inside
+        # the first test would take minutes and count against its timeout
+        self._pull = threading.Thread(target=self._pull_image, daemon=True)
+        self._pull.start()
+
+    def cache_key(self) -> Optional[str]:
+        """Identifies the sandbox build; cached results only count while it matches
+
+        The local image ID rather than the tag, so re-pulling the tag
+        invalidates results. None while the image isn't present yet.
+        """
+        if self._image_id is None:
+            try:
+                result = subprocess.run(
+                    ["docker", "image", "inspect", "--format", "{{.Id}}", self.image],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            if result.returncode == 0 and result.stdout.strip():
+                self._image_id = result.stdout.strip()
+        return self._image_id
+
+    def _pull_image(self):
+        """Pull the image unless it is already present locally"""
+        try:
+            present = subprocess.run(
+                ["docker", "image", "inspect", self.image],
+                capture_output=True,
+                timeout=30
+            ).returncode == 0
+            if not present:
+                subprocess.run(["docker", "image", "pull", self.image], capture_output=True, timeout=600)
+        except (OSError, subprocess.TimeoutExpired):
+            # `docker run` still pulls on demand
+            pass
+
+    def _shared_container(self) -> Optional[str]:
+        """Start the shared container on first use; None if it can't start"""
+        with self._container_lock:
+            if self._container_id is None and not self._container_failed:
+                try:
+                    result = subprocess.run(
+                        ["docker", "run", "-d", "--rm", "--init", self.image, "sleep", "infinity"],
+                        capture_output=True,
+                        text=True,
+                        timeout=60
+                    )
+                    if result.returncode == 0:
+                        self._container_id = result.stdout.strip()
+                    else:
+                        self._container_failed = True
+                except (OSError, subprocess.TimeoutExpired):
+                    self._container_failed = True
+            return self._container_id
+
+    def _command(self, test: SecurityTest) -> list:
+        if test.name not in self.FRESH_CONTAINER_TESTS:
+            container_id = self._shared_container()
+            if container_id:
+                return ["docker", "exec", "-i", container_id, "python", "-u", "-c", test.code]
+        return ["docker", "run", "--rm", self.image, "python", "-u", "-c", test.code]
     
     def run_test(self, test: SecurityTest) -> SecurityResult:
         """Run a single security test"""
+        self._pull.join()
         try:
-            result = subprocess.run(
-                ["docker", "run", "--rm", self.image, "python", "-c", test.code],
-                capture_output=True,
-                timeout=test.timeout
-            )
+            command = self._command(test)
+            with self._slots:
+                result = _run_bounded(command, test.timeout)
             
-            output = result.stdout.decode() + result.stderr.decode()
-            
-            if test.success_indicator in output:
-                return SecurityResult.ALLOWED
-            elif '"result": "PARTIAL"' in output:
-                return SecurityResult.PARTIAL
-            else:
-                return SecurityResult.BLOCKED
+            return classify_output(test, result.stdout + result.stderr)
                 
         except subprocess.TimeoutExpired:
-            return SecurityResult.BLOCKED
+            return timed_out(self, test)
         except Exception:
             return SecurityResult.ERROR
 
+    def run_tests(self, tests) -> List[Tuple[SecurityTest, SecurityResult]]:
+        """Run tests with one `docker exec` for everything the shared container takes
+
+        Each test still gets its own python process and timeout inside the
+        container, one at a time, but the exec round trip is paid once.
+        Fresh-container tests run alongside the batch; anything the batch
+        doesn't answer goes through run_test.
+        """
+        self._pull.join()
+        batched = [test for test in tests if test.name not in self.FRESH_CONTAINER_TESTS]
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_CONTAINERS) as executor:
+            fresh = {
+                test: executor.submit(self.run_test, test)
+                for test in tests if test.name in self.FRESH_CONTAINER_TESTS
+            }
+            answered = self._run_batch(batched) if batched else {}
+            return [
+                (test, fresh[test].result() if test in fresh
+                 else answered[test.name] if test.name in answered
+                 else self.run_test(test))
+                for test in tests
+            ]
+
+    def _run_batch(self, tests) -> dict:
+        """{test name: SecurityResult} for the tests the batch driver answered"""
+        container_id = self._shared_container()
+        if not container_id:
+            return {}
+        by_name = {test.name: test for test in tests}
+        payload = json.dumps([
+            {"name": test.name, "code": test.code, "timeout": test.timeout} for test in tests
+        ])
+        try:
+            with tempfile.TemporaryFile() as stdin, self._slots:
+                stdin.write(payload.encode())
+                stdin.seek(0)
+                # Each answer carries at most MAX_OUTPUT_BYTES of output, which
+                # JSON escaping can grow; lines past the cap fall back to run_test
+                result = _run_bounded(
+                    ["docker", "exec", "-i", container_id, "python", "-u", "-c", DOCKER_BATCH_DRIVER],
+                    sum(test.timeout for test in tests) + 30,
+                    max_bytes=2 * MAX_OUTPUT_BYTES * len(tests),
+                    stdin=stdin
+                )
+        except (OSError, subprocess.TimeoutExpired):
+            return {}
+
+        answered = {}
+        for line in result.stdout.splitlines():
+            try:
+                msg = json.loads(line)
+                test = by_name[msg["name"]]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if msg.get("timed_out"):
+                answered[test.name] = timed_out(self, test)
+            else:
+                answered[test.name] = classify_output(test, msg.get("output", "").encode())
+        return answered
+
+    def cleanup(self):
+        """Remove the shared container"""
+        if self._container_id:
+            subprocess.run(["docker", "rm", "-f", self._container_id], capture_output=True)
+            self._container_id = None
+
+
+PYODIDE_DRIVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pyodide_security_driver.js")
+# Where an installed Pyodide npm package may be found, in lookup order
+PYODIDE_PACKAGE_PATHS = (
+    os.path.join(os.path.dirname(__file__), "node_modules", "pyodide", "package.json"),
+    os.path.join(os.getcwd(), "node_modules", "pyodide", "package.json"),
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "node_modules", "pyodide", "package.json"),
+)
+
 
 class PyodideSecurityTest:
-    """Pyodide (WebAssembly) security test"""
+    """Pyodide (WebAssembly) security test
+
+    Tests run in one persistent Node process (pyodide_security_driver.js) that
+    loads Pyodide once, so the multi-second WASM bootstrap isn't paid per test.
+    Each test gets fresh globals. If the driver can't start, tests fall back to
+    a one-shot Node process each.
+    """
+
+    # Tests share one Pyodide interpreter, so main() submits them as a single
+    # run_tests() batch instead of parking pool workers on the driver lock
+    BATCH = True
+
+    # Seconds allowed for node + loadPyodide() before giving up on the driver
+    DRIVER_LOAD_TIMEOUT = 60
 
     def __init__(self):
         self.node_available = check_command_available("node")
         # Check if Pyodide is installed (by checking file system)
         self.pyodide_available = self._check_pyodide_installed()
+        self.timed_out: Set[str] = set()
+        self._driver: Optional[subprocess.Popen] = None
+        self._driver_lines: Optional[queue.Queue] = None
+        self._driver_failed = False
+        self._driver_lock = threading.Lock()
+        self._request_id = 0
 
-    def _check_pyodide_installed(self) -> bool:
+    @staticmethod
+    def _check_pyodide_installed() -> bool:
         """Check if Pyodide npm package is installed"""
-        # Check multiple possible installation locations
-        possible_paths = [
-            os.path.join(os.path.dirname(__file__), "node_modules", "pyodide", "package.json"),
-            os.path.join(os.getcwd(), "node_modules", "pyodide", "package.json"),
-            os.path.join(os.path.dirname(os.path.dirname(__file__)), "node_modules", "pyodide", "package.json"),
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
+        return PyodideSecurityTest._pyodide_package_json() is not None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _pyodide_package_json() -> Optional[str]:
+        """Path of the installed Pyodide package.json, if any (looked up once)"""
+        for path in PYODIDE_PACKAGE_PATHS:
+            try:
+                os.stat(path)
+                return path
+            except OSError:
+                continue
+        return None
+
+    def cache_key(self) -> str:
+        """Identifies the sandbox build; cached results only count while it matches"""
+        package_json = self._pyodide_package_json()
+        return f"{package_json}:{_binary_mtime_ns(package_json)}"
+
+    def _start_driver(self) -> bool:
+        """Spawn the driver and wait until Pyodide is loaded"""
+        benchmark_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            proc = subprocess.Popen(
+                ["node", PYODIDE_DRIVER],
+                start_new_session=True,  # So _stop_driver() can reap Node's workers too
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                cwd=benchmark_dir  # So require("pyodide") finds node_modules
+            )
+        except OSError:
+            return False
+
+        lines: queue.Queue = queue.Queue()
+
+        def pump():
+            for line in proc.stdout:
+                lines.put(line)
+            lines.put(None)  # EOF: driver exited
+
+        threading.Thread(target=pump, daemon=True).start()
+        self._driver, self._driver_lines = proc, lines
+        try:
+            if self._read_message(lambda msg: msg.get("ready"), self.DRIVER_LOAD_TIMEOUT) is not None:
                 return True
-        
+        except subprocess.TimeoutExpired:
+            pass
+        self._stop_driver()
         return False
+
+    def _stop_driver(self):
+        if self._driver is not None:
+            _kill_process_group(self._driver.pid)
+            self._driver.wait()
+            self._driver = None
+            self._driver_lines = None
+
+    def _read_message(self, matches, timeout: float) -> Optional[dict]:
+        """Next driver message satisfying matches; None if the driver exited"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._driver_lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(PYODIDE_DRIVER, timeout)
+            if line is None:
+                return None
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                continue  # Stray console output from Pyodide itself
+            if isinstance(msg, dict) and matches(msg):
+                return msg
+
+    def _run_in_driver(self, test: SecurityTest) -> Optional[str]:
+        """Run test in the persistent driver; None if the driver is unusable"""
+        with self._driver_lock:
+            if self._driver is None:
+                if self._driver_failed or not self._start_driver():
+                    self._driver_failed = True
+                    return None
+
+            self._request_id += 1
+            request_id = self._request_id
+            try:
+                self._driver.stdin.write(json.dumps({"id": request_id, "code": test.code}) + "\n")
+                self._driver.stdin.flush()
+                # Same budget as the one-shot path, so results stay comparable
+                msg = self._read_message(lambda m: m.get("id") == request_id, test.timeout + 10)
+            except subprocess.TimeoutExpired:
+                # The interpreter is stuck in the test; restart it for the next one
+                self._stop_driver()
+                raise
+            except OSError:
+                msg = None
+            if msg is None:
+                self._stop_driver()
+                return None
+            return msg.get("output", "")
+
+    def cleanup(self):
+        """Shut down the persistent driver"""
+        with self._driver_lock:
+            if self._driver is not None:
+                try:
+                    self._driver.stdin.close()
+                    self._driver.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+                self._stop_driver()
     
     def run_test(self, test: SecurityTest) -> SecurityResult:
         """Run a single security test"""
@@ -637,70 +1242,111 @@ class PyodideSecurityTest:
         
         if not self.pyodide_available:
             return SecurityResult.ERROR
-        
-        # Pyodide runs in WebAssembly, naturally isolating most system calls
-        # Here we simulate its behavior
-        escaped_code = test.code.replace('`', '\\`')
-        js_code = f'''
-const {{ loadPyodide }} = require("pyodide");
-
-async function main() {{
-    try {{
-        const pyodide = await loadPyodide();
-        const result = await pyodide.runPythonAsync(`{escaped_code}`);
-        console.log(result);
-    }} catch (e) {{
-        console.log(JSON.stringify({{"result": "BLOCKED", "error": e.message}}));
-    }}
-}}
-
-main();
-'''
-        
+
+        try:
+            output = self._run_in_driver(test)
+        except subprocess.TimeoutExpired:
+            print(f"  [Pyodide Timeout] {test.description}: Execution timeout", file=sys.stderr)
+            return timed_out(self, test)
+        if output is None:
+            return self._run_one_shot(test)
+        return self._classify(test, output)
+
+    def run_tests(self, tests) -> List[Tuple[SecurityTest, SecurityResult]]:
+        """Run tests through the driver with every request submitted up front
+
+        All requests go to the driver in one write, then answers are collected
+        in order, each with the same budget as run_test. Whatever the batch
+        doesn't finish (a timeout, or the driver dying) goes through run_test,
+        which restarts the driver or falls back to one-shot runs.
+        """
+        if not self.node_available or not self.pyodide_available:
+            return [(test, SecurityResult.ERROR) for test in tests]
+
+        results = []
+        with self._driver_lock:
+            if self._driver is None and (self._driver_failed or not self._start_driver()):
+                self._driver_failed = True
+            else:
+                request_ids = range(self._request_id + 1, self._request_id + 1 + len(tests))
+                self._request_id += len(tests)
+                try:
+                    self._driver.stdin.write("".join(
+                        json.dumps({"id": request_id, "code": test.code}) + "\n"
+                        for test, request_id in zip(tests, request_ids)
+                    ))
+                    self._driver.stdin.flush()
+                    for test, request_id in zip(tests, request_ids):
+                        msg = self._read_message(
+                            lambda m, request_id=request_id: m.get("id") == request_id,
+                            test.timeout + 10
+                        )
+                        if msg is None:
+                            break
+                        results.append((test, self._classify(test, msg.get("output", ""))))
+                except subprocess.TimeoutExpired:
+                    test = tests[len(results)]
+                    print(f"  [Pyodide Timeout] {test.description}: Execution timeout", file=sys.stderr)
+                    results.append((test, timed_out(self, test)))
+                except OSError:
+                    pass
+                if len(results) < len(tests):
+                    # Stuck or dead; later requests in the batch are lost with it
+                    self._stop_driver()
+
+        results.extend((test, self.run_test(test)) for test in tests[len(results):])
+        return results
+
+    def _classify(self, test: SecurityTest, output: str) -> SecurityResult:
+        """Map a driver answer's captured output to a SecurityResult"""
+        output = output.encode()
+        if test.success_bytes in output:
+            return SecurityResult.ALLOWED
+        elif BLOCKED_MARKER in output:
+            return SecurityResult.BLOCKED
+        else:
+            # Execution succeeded but no success indicator matched, treated as blocked
+            return SecurityResult.BLOCKED
+
+    def _run_one_shot(self, test: SecurityTest) -> SecurityResult:
+        """Run a single security test in its own driver process
+
+        The test is the only request a fresh pyodide_security_driver.js gets
+        on stdin, so its code reaches Pyodide as JSON data instead of being
+        spliced (and escaped) into generated JavaScript.
+        """
         try:
-            # Create temporary file in benchmark directory instead of system temp directory
-            # So that Node.js can correctly find the pyodide module
             benchmark_dir = os.path.dirname(os.path.abspath(__file__))
-            js_file = os.path.join(benchmark_dir, f".pyodide_test_{os.getpid()}_{test.name}.js")
-            
-            with open(js_file, 'w') as f:
-                f.write(js_code)
-            
-            try:
-                result = subprocess.run(
-                    ["node", js_file],
-                    capture_output=True,
-                    timeout=test.timeout + 10,  # Pyodide loading needs extra time
-                    cwd=benchmark_dir
+            with tempfile.TemporaryFile() as stdin:
+                stdin.write((json.dumps({"id": 0, "code": test.code}) + "\n").encode())
+                stdin.seek(0)
+                result = _run_bounded(
+                    ["node", PYODIDE_DRIVER],
+                    test.timeout + 10,  # Pyodide loading needs extra time
+                    # The answer is the test's capped output, JSON-escaped
+                    max_bytes=8 * MAX_OUTPUT_BYTES,
+                    kill_group=True,
+                    cwd=benchmark_dir,  # So require("pyodide") finds node_modules
+                    stdin=stdin
                 )
-            finally:
-                # Clean up temporary file
-                if os.path.exists(js_file):
-                    os.unlink(js_file)
-            
-            output = result.stdout.decode() + result.stderr.decode()
 
-            # Debug output: show actual execution result
-            if result.returncode != 0:
-                print(f"  [Pyodide Debug] {test.description}: Node.js return code {result.returncode}", file=sys.stderr)
-                if output:
-                    print(f"  [Pyodide Debug] Output: {output[:200]}", file=sys.stderr)
-            
-            if test.success_indicator in output:
-                return SecurityResult.ALLOWED
-            elif '"result": "BLOCKED"' in output:
-                return SecurityResult.BLOCKED
-            elif result.returncode != 0:
-                # Node.js execution failed, meaning Pyodide is really not available
-                print(f"  [Pyodide Error] {test.description}: Execution failed (return code {result.returncode})", file=sys.stderr)
-                return SecurityResult.ERROR
-            else:
-                # Execution succeeded but no success indicator matched, treated as blocked
-                return SecurityResult.BLOCKED
+            for line in result.stdout.splitlines():
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(msg, dict) and msg.get("id") == 0:
+                    return self._classify(test, msg.get("output", ""))
+
+            # No answer: Node.js or loadPyodide() failed, meaning Pyodide is really not available
+            print(f"  [Pyodide Error] {test.description}: Execution failed (return code {result.returncode})", file=sys.stderr)
+            if result.stderr:
+                print(f"  [Pyodide Debug] Output: {result.stderr[:200].decode(errors='replace')}", file=sys.stderr)
+            return SecurityResult.ERROR
                 
         except subprocess.TimeoutExpired:
             print(f"  [Pyodide Timeout] {test.description}: Execution timeout", file=sys.stderr)
-            return SecurityResult.BLOCKED
+            return timed_out(self, test)
         except Exception as e:
             # Real error case, should not return preset result
             print(f"  [Pyodide Error] {test.description}: {str(e)}", file=sys.stderr)
@@ -716,6 +1362,20 @@ main();
         return SecurityResult.ERROR
 
 
+def _python3_pyc_compatible() -> bool:
+    """Whether `python3` on PATH can run .pyc files written by this interpreter"""
+    try:
+        result = subprocess.run(
+            ["python3", "-c", "import importlib.util,sys; sys.stdout.write(importlib.util.MAGIC_NUMBER.hex())"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.stdout == importlib.util.MAGIC_NUMBER.hex()
+
+
 class ClaudeSRTSecurityTest:
     """Claude SRT (Sandboxed Runtime) security test
 
@@ -724,48 +1384,51 @@ class ClaudeSRTSecurityTest:
     """
     
     def __init__(self):
-        self.work_dir = tempfile.mkdtemp(prefix="claude_srt_security_")
+        self.work_dir = _shm_mkdtemp("claude_srt_security_")
+        self.timed_out: Set[str] = set()
+        # Every test's script is written once here, so run_test does no
+        # filesystem writes. Precompiled bytecode lets the sandboxed child skip
+        # parsing, but only when srt's python3 reads this interpreter's .pyc format
+        use_pyc = _python3_pyc_compatible()
+        self.script_paths = {
+            test.name: self._write_script(test, use_pyc) for test in SECURITY_TESTS
+        }
+
+    def cache_key(self) -> str:
+        """Identifies the sandbox build; cached results only count while it matches"""
+        srt_path = shutil.which("srt")
+        return f"{srt_path}:{_binary_mtime_ns(srt_path)}"
+
+    def _write_script(self, test: SecurityTest, use_pyc: bool) -> str:
+        """Write test as .pyc or .py source in work_dir; returns its path"""
+        if use_pyc:
+            script_path = os.path.join(self.work_dir, f"{test.name}.pyc")
+            _write_file(script_path, importlib.util.MAGIC_NUMBER + b"\0" * 12
+                        + marshal.dumps(compile(test.code, test.name, "exec")))
+        else:
+            script_path = os.path.join(self.work_dir, f"{test.name}.py")
+            _write_file(script_path, test.code.encode())
+        return script_path
     
     def run_test(self, test: SecurityTest) -> SecurityResult:
         """Run a single security test"""
-        # Write test code to temporary file
-        script_path = os.path.join(self.work_dir, "test_script.py")
-        with open(script_path, "w") as f:
-            f.write(test.code)
+        script_path = self.script_paths.get(test.name) or self._write_script(test, False)
         
         try:
             # Use srt command to run Python script (using python3)
-            result = subprocess.run(
-                ["srt", "python3", script_path],
-                capture_output=True,
-                timeout=test.timeout,
+            result = _run_bounded(
+                ["srt", "python3", "-u", script_path],
+                test.timeout,
+                kill_group=True,
+                stop_markers=result_markers(test),
                 cwd=self.work_dir
             )
             
-            output = result.stdout.decode() + result.stderr.decode()
-
-            # Check if attack succeeded
-            if test.success_indicator in output:
-                return SecurityResult.ALLOWED
-            elif '"result": "PARTIAL"' in output:
-                return SecurityResult.PARTIAL
-            # Check if blocked by SRT security mechanism
-            elif "Permission denied" in output or "Operation not permitted" in output:
-                return SecurityResult.BLOCKED
-            elif "seccomp" in output.lower() or "sandbox" in output.lower():
-                return SecurityResult.BLOCKED
-            elif '"result": "BLOCKED"' in output:
-                return SecurityResult.BLOCKED
-            # If execution failed, check if it was a security block
-            elif result.returncode != 0:
-                if any(keyword in output.lower() for keyword in ["denied", "permission", "blocked", "forbidden"]):
-                    return SecurityResult.BLOCKED
-                return SecurityResult.BLOCKED  # Execution failure treated as blocked
-            else:
-                return SecurityResult.BLOCKED
+            # SRT denials, sandbox errors and failed runs all count as blocked
+            return classify_output(test, result.stdout + result.stderr)
                 
         except subprocess.TimeoutExpired:
-            return SecurityResult.BLOCKED  # Timeout treated as blocked
+            return timed_out(self, test)
         except Exception as e:
             return SecurityResult.ERROR
     
@@ -776,67 +1439,322 @@ class ClaudeSRTSecurityTest:
 
 
 
+# Tests grouped by category (in definition order) and the test-name column
+# width, both fixed once SECURITY_TESTS is defined
+TEST_CATEGORIES = {}
+for _test in SECURITY_TESTS:
+    TEST_CATEGORIES.setdefault(_test.category, []).append(_test)
+del _test
+NAME_WIDTH = max(len(t.description) for t in SECURITY_TESTS) + 2
+PLATFORM_WIDTH = 14
+
+
+def _display_width(text: str) -> int:
+    """Terminal columns text takes: wide chars and emoji-presentation chars count 2"""
+    width = 0
+    for i, char in enumerate(text):
+        if char == "\ufe0f" or unicodedata.combining(char):
+            continue
+        emoji = text[i + 1:i + 2] == "\ufe0f"
+        width += 2 if emoji or unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+def _center_display(text: str, width: int) -> str:
+    """str.center() by display width rather than code points"""
+    padding = max(width - _display_width(text), 0)
+    return " " * (padding // 2) + text + " " * (padding - padding // 2)
+
+
+# Padded row labels and result cells, so the table is built from ready strings.
+# Result values start with an emoji, so cells are centered by display width
+TEST_ROW_LABELS = {t.name: f"| {t.description.ljust(NAME_WIDTH)} |" for t in SECURITY_TESTS}
+RESULT_CELLS = {result: f" {_center_display(result.value, PLATFORM_WIDTH)} |" for result in SecurityResult}
+
+
 def print_results_table(results: dict, platforms: list):
     """Print results table"""
-    # Group by category
-    categories = {}
-    for test in SECURITY_TESTS:
-        if test.category not in categories:
-            categories[test.category] = []
-        categories[test.category].append(test)
-
-    # Calculate column width
-    name_width = max(len(t.description) for t in SECURITY_TESTS) + 2
-    platform_width = 14
-
-    # Print header
-    header = f"| {'Test Item'.ljust(name_width)} |"
-    for platform in platforms:
-        header += f" {platform.center(platform_width)} |"
-    print(header)
-    
-    separator = f"|{'-' * (name_width + 2)}|"
-    for _ in platforms:
-        separator += f"{'-' * (platform_width + 2)}|"
-    print(separator)
-
-    # Print results by category
-    for category, tests in categories.items():
-        # Print category title
-        print(f"| **{category}** |" + " |" * len(platforms))
+    # Header
+    rows = [
+        f"| {'Test Item'.ljust(NAME_WIDTH)} |"
+        + "".join(f" {platform.center(PLATFORM_WIDTH)} |" for platform in platforms),
+        f"|{'-' * (NAME_WIDTH + 2)}|" + f"{'-' * (PLATFORM_WIDTH + 2)}|" * len(platforms),
+    ]
+
+    # Each platform's results looked up once, not once per row
+    platform_results = [results.get(platform, {}) for platform in platforms]
+
+    # Results by category
+    for category, tests in TEST_CATEGORIES.items():
+        # Category title
+        rows.append(f"| **{category}** |" + " |" * len(platforms))
         
         for test in tests:
-            row = f"| {test.description.ljust(name_width)} |"
-            for platform in platforms:
-                result = results.get(platform, {}).get(test.name, SecurityResult.SKIPPED)
-                row += f" {result.value.center(platform_width)} |"
-            print(row)
+            rows.append(TEST_ROW_LABELS[test.name] + "".join([
+                RESULT_CELLS[by_test.get(test.name, SecurityResult.SKIPPED)]
+                for by_test in platform_results
+            ]))
     
-    print()
+    # One write for the whole table instead of a flush per line
+    sys.stdout.write("\n".join(rows) + "\n\n")
+    sys.stdout.flush()
+
+
+def platform_security_score(platform_results: dict) -> dict:
+    """Calculate one platform's security score"""
+    # One pass over the results instead of one per outcome
+    counts = Counter(platform_results.values())
+    blocked = counts[SecurityResult.BLOCKED]
+    partial = counts[SecurityResult.PARTIAL]
+    total = len(platform_results) - counts[SecurityResult.SKIPPED]
+    
+    if total > 0:
+        score = (blocked + partial * 0.5) / total * 100
+    else:
+        score = 0
+    
+    return {
+        "blocked": blocked,
+        "partial": partial,
+        "allowed": counts[SecurityResult.ALLOWED],
+        "total": total,
+        "score": score
+    }
 
 
 def calculate_security_score(results: dict) -> dict:
     """Calculate security score"""
-    scores = {}
-    for platform, platform_results in results.items():
-        blocked = sum(1 for r in platform_results.values() if r == SecurityResult.BLOCKED)
-        partial = sum(1 for r in platform_results.values() if r == SecurityResult.PARTIAL)
-        total = len([r for r in platform_results.values() if r != SecurityResult.SKIPPED])
-        
-        if total > 0:
-            score = (blocked + partial * 0.5) / total * 100
-        else:
-            score = 0
-        
-        scores[platform] = {
-            "blocked": blocked,
-            "partial": partial,
-            "allowed": sum(1 for r in platform_results.values() if r == SecurityResult.ALLOWED),
-            "total": total,
-            "score": score
+    return {platform: platform_security_score(platform_results) for platform, platform_results in results.items()}
+
+
+# Prefix of --jsonl records, so they can be grepped out of the other output
+JSONL_PREFIX = "@@BENCH_JSON@@ "
+
+
+def jsonl_record(record: dict) -> str:
+    """One --jsonl record line"""
+    if orjson is not None:
+        # Same compact, non-ASCII-escaping form as the json fallback
+        return JSONL_PREFIX + orjson.dumps(record).decode() + "\n"
+    return JSONL_PREFIX + json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+# Result cache: ~/.cache/skilllite-bench/security_vs.json
+RESULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "skilllite-bench", "security_vs.json")
+
+
+class ResultCache:
+    """Reuse results across runs per (platform, tester, test code, sandbox build)
+
+    One entry per platform and test, so a rebuilt binary or edited test
+    replaces its entry instead of piling up new ones. Each tester's
+    cache_key() names the build under test (None: unknown, nothing is
+    cached). Errors and timeouts are never cached.
+    """
+
+    def __init__(self, enabled: bool = False, path: str = RESULT_CACHE_PATH):
+        self.enabled = enabled
+        self.path = path
+        self._entries: dict = {}
+        self._dirty = False
+        if enabled:
+            try:
+                with open(path) as f:
+                    entries = json.load(f)
+                if isinstance(entries, dict):
+                    self._entries = entries
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _entry(tester, test: SecurityTest) -> Optional[dict]:
+        build = tester.cache_key()
+        if build is None:
+            return None
+        return {
+            # The CLI and IPC testers share platform names but not a code path
+            "tester": type(tester).__name__,
+            "code": hashlib.blake2b(test.code.encode(), digest_size=16).hexdigest(),
+            "build": build,
         }
-    
-    return scores
+
+    def get(self, platform: str, tester, test: SecurityTest) -> Optional[SecurityResult]:
+        """Cached result for test on platform, or None on a miss"""
+        if not self.enabled:
+            return None
+        cached = self._entries.get(f"{platform}|{test.name}")
+        if not isinstance(cached, dict):
+            return None
+        expected = self._entry(tester, test)
+        if expected is None or any(cached.get(k) != v for k, v in expected.items()):
+            return None
+        return SecurityResult.__members__.get(cached.get("result"))
+
+    def put(self, platform: str, tester, test: SecurityTest, result: SecurityResult):
+        # Errors and timeouts are usually environmental and transient; don't pin them
+        if not self.enabled or result == SecurityResult.ERROR or test.name in tester.timed_out:
+            return
+        entry = self._entry(tester, test)
+        if entry is None:
+            return
+        self._entries[f"{platform}|{test.name}"] = {**entry, "result": result.name}
+        self._dirty = True
+
+    def save(self):
+        """Persist new entries, replacing the file atomically"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}"
+            with open(tmp_path, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+        self._dirty = False
+
+
+def _indented_json(value, indent: int) -> str:
+    """json.dumps(value, indent=2) shifted right to sit at the given depth"""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + " " * indent)
+
+
+class JsonResultsWriter:
+    """Write the --output JSON file incrementally
+
+    The results object is opened up front and each platform's results are
+    written as soon as that platform and every platform before it have
+    finished, so a crash keeps completed platforms on disk and results are
+    never held twice in memory. The file matches json.dump(..., indent=2).
+    """
+
+    def __init__(self, path: str, platforms: list):
+        self._file = open(path, "w")
+        self._pending = list(platforms)
+        self._done = {}
+        self._first = True
+        self._file.write('{\n  "results": {')
+
+    def add_platform(self, platform: str, platform_results: dict):
+        """Record a finished platform's results ({test name: SecurityResult}, in test order)"""
+        self._done[platform] = {name: result.name for name, result in platform_results.items()}
+        # Keep platform order: write the longest finished prefix
+        while self._pending and self._pending[0] in self._done:
+            name = self._pending.pop(0)
+            self._file.write(
+                ("" if self._first else ",")
+                + f"\n    {json.dumps(name, ensure_ascii=False)}: {_indented_json(self._done.pop(name), 4)}"
+            )
+            self._first = False
+        self._file.flush()
+
+    def close(self, scores: dict, tests: list, cached: Optional[dict] = None):
+        """Write the trailing sections and close the file
+
+        cached ({platform: [test name, ...]}) lists results reused from the
+        result cache rather than measured in this run; omitted when empty.
+        """
+        self._file.write("}," if self._first else "\n  },")
+        self._file.write(f'\n  "scores": {_indented_json(scores, 2)},')
+        if cached:
+            self._file.write(f'\n  "cached": {_indented_json(cached, 2)},')
+        self._file.write(f'\n  "tests": {_indented_json(tests, 2)}\n}}')
+        self._file.close()
+
+
+# Categories whose results depend on how loaded the host is (500MB
+# allocations, fork bombs, a CPU loop scored by its timeout): main() runs
+# them one at a time after the pool has drained
+SERIAL_CATEGORIES = {"Resource Limits"}
+
+
+def run_tests_serially(tester, tests) -> List[Tuple[SecurityTest, SecurityResult]]:
+    """Run tests one after another on tester"""
+    return [(test, tester.run_test(test)) for test in tests]
+
+
+SKILLLITE_LEVEL_NAMES = {
+    1: "No Sandbox",
+    2: "Sandbox Only",
+    3: "Sandbox + Static Check"
+}
+# --skillbox-level values that expand to several levels; the default 2 also
+# tests Level 3 for comprehensive security comparison
+SKILLLITE_LEVEL_SETS = {2: [2, 3]}
+
+
+@dataclass(frozen=True)
+class PlatformSpec:
+    """A platform main() may test: how to check for it and build its tester"""
+    name: str
+    banner: str  # Printed when the platform is tested
+    factory: Callable[[], object]
+    unavailable: Callable[[], Optional[str]]  # Why it's skipped ("" = silently), or None
+
+
+def platform_specs(args, skilllite_path: Optional[str]) -> List[PlatformSpec]:
+    """Every platform in report order; availability is only checked when asked"""
+    specs = []
+
+    # SkillLite Test (Rust binary in skilllite/ directory)
+    if skilllite_path:
+        if args.test_all_levels:
+            test_levels = [1, 2, 3]
+        else:
+            test_levels = SKILLLITE_LEVEL_SETS.get(args.skillbox_level, [args.skillbox_level])
+        tester_cls = SkillLiteIPCSecurityTest if args.ipc else SkillLiteSecurityTest
+        specs.extend(
+            PlatformSpec(
+                name=f"SkillLite (Level {level})",
+                banner=f"🦀 Testing SkillLite (Level {level}) - {SKILLLITE_LEVEL_NAMES[level]} ({skilllite_path})",
+                factory=lambda level=level: tester_cls(skilllite_path, sandbox_level=level),
+                unavailable=lambda: None,
+            )
+            for level in test_levels
+        )
+    else:
+        specs.append(PlatformSpec(
+            name="SkillLite",
+            banner="",
+            factory=lambda: None,
+            unavailable=lambda: "⚠️  SkillLite not available, skipping test",
+        ))
+
+    def docker_unavailable():
+        if args.skip_docker:
+            return "⏭️  Skipping Docker test"
+        if not check_docker_available():
+            return "⚠️  Docker not available, skipping test"
+        return None
+
+    def pyodide_unavailable():
+        if args.skip_pyodide:
+            return ""  # Skipped silently
+        if not check_command_available("node"):
+            return "⚠️  Node.js not available, skipping Pyodide test"
+        if not PyodideSecurityTest._check_pyodide_installed():
+            return ("⚠️  Pyodide npm package not installed, skipping test\n"
+                    "   Hint: Run 'npm install pyodide' to install")
+        return None
+
+    def claude_srt_unavailable():
+        if args.skip_claude_srt:
+            return "⏭️  Skipping Claude SRT test"
+        if not check_claude_srt_available():
+            return ("⚠️  Claude SRT not available, skipping test\n"
+                    "   Hint: Please ensure the srt command-line tool is installed")
+        return None
+
+    specs.extend([
+        PlatformSpec("Docker", f"🐳 Testing Docker ({args.docker_image})",
+                     lambda: DockerSecurityTest(args.docker_image), docker_unavailable),
+        PlatformSpec("Pyodide", "🌐 Testing Pyodide (WebAssembly)",
+                     PyodideSecurityTest, pyodide_unavailable),
+        PlatformSpec("Claude SRT", "🤖 Testing Claude SRT (Sandboxed Runtime)",
+                     ClaudeSRTSecurityTest, claude_srt_unavailable),
+    ])
+    return specs
 
 
 def main():
@@ -854,155 +1772,178 @@ def main():
                        help="SkillLite sandbox level (1=No sandbox, 2=Sandbox only, 3=Sandbox+static check)")
     parser.add_argument("--test-all-levels", action="store_true",
                        help="Test all SkillLite security levels (1, 2, 3)")
+    parser.add_argument("--ipc", action="store_true",
+                       help="Run SkillLite tests through one `skilllite serve --stdio` daemon per level")
+    parser.add_argument("--cache", action="store_true",
+                       help=f"Reuse results cached in {RESULT_CACHE_PATH} (marked as cached in every output)")
+    parser.add_argument("--jsonl", action="store_true",
+                       help="Emit one @@BENCH_JSON@@ line per result instead of the markdown tables")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                       help="Number of tests to run concurrently (1 = serial)")
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {args.jobs}")
     
     print("=" * 60)
     print("SkillLite Security Benchmark")
     print("=" * 60)
     print()
     
-    results = {}
     platforms = []
+    testers = {}
     
-    # SkillLite Test (Rust binary in skilllite/ directory)
     skilllite_available, skilllite_path = check_skilllite_available(args.skilllite)
-    if skilllite_available:
-        # Determine security levels to test
-        if args.test_all_levels:
-            test_levels = [1, 2, 3]
-        elif args.skillbox_level == 2:
-            # Default: test both Level 2 and 3 for comprehensive security comparison
-            test_levels = [2, 3]
-        else:
-            test_levels = [args.skillbox_level]
+    for spec in platform_specs(args, skilllite_path if skilllite_available else None):
+        reason = spec.unavailable()
+        if reason is not None:
+            if reason:
+                print(reason)
+            continue
+        print(spec.banner)
+        testers[spec.name] = tester = spec.factory()
+        if hasattr(tester, "cleanup"):
+            # Runs on normal exit, errors and Ctrl-C alike
+            atexit.register(tester.cleanup)
+        platforms.append(spec.name)
+    print()
 
-        level_names = {
-            1: "No Sandbox",
-            2: "Sandbox Only",
-            3: "Sandbox + Static Check"
-        }
+    results = {platform: {} for platform in platforms}
+    scores = {}
+    writer = JsonResultsWriter(args.output, platforms) if args.output else None
+    cache = ResultCache(enabled=args.cache)
+    cached_tests = {platform: [] for platform in platforms}
 
-        for level in test_levels:
-            platform_name = f"SkillLite (Level {level})"
-            print(f"🦀 Testing {platform_name} - {level_names[level]} ({skilllite_path})...")
-            skilllite_tester = SkillLiteSecurityTest(skilllite_path, sandbox_level=level)
-            results[platform_name] = {}
-            platforms.append(platform_name)
-            
-            for test in SECURITY_TESTS:
-                result = skilllite_tester.run_test(test)
-                results[platform_name][test.name] = result
-                print(f"  {test.description}: {result.value}")
-            
-            skilllite_tester.cleanup()
-            print()
-    else:
-        print("⚠️  SkillLite not available, skipping test")
-        print()
-    
-    # Docker Test
-    if not args.skip_docker and check_docker_available():
-        print(f"🐳 Testing Docker ({args.docker_image})...")
-        docker_tester = DockerSecurityTest(args.docker_image)
-        results["Docker"] = {}
-        platforms.append("Docker")
-        
+    def collect(platform: str, pairs, cached: bool = False):
+        """Record (test, result) pairs; one write per call"""
+        lines = []
+        for test, result in pairs:
+            results[platform][test.name] = result
+            if cached:
+                cached_tests[platform].append(test.name)
+            if args.jsonl:
+                record = {
+                    "platform": platform,
+                    "level": getattr(testers[platform], "sandbox_level", None),
+                    "test": test.name,
+                    "category": test.category,
+                    "result": result.name,
+                }
+                if cached:
+                    record["cached"] = True
+                lines.append(jsonl_record(record))
+            else:
+                suffix = " (cached)" if cached else ""
+                lines.append(f"  {platform} / {test.description}: {result.value}{suffix}\n")
+        if len(results[platform]) == len(SECURITY_TESTS):
+            # Platform finished: put its results back in test order (completion
+            # order scrambled them) with one assignment, and score it right away
+            # rather than after every other platform is done
+            results[platform] = {test.name: results[platform][test.name] for test in SECURITY_TESTS}
+            scores[platform] = score = platform_security_score(results[platform])
+            if args.jsonl:
+                lines.append(jsonl_record({"platform": platform, "score": score}))
+            else:
+                lines.append(f"  ➜ {platform} finished: {score['score']:.1f}% security score\n")
+            if writer:
+                writer.add_platform(platform, results[platform])
+        sys.stdout.write("".join(lines))
+
+    # Split each platform's tests into cached results and tests still to run
+    cached_pairs = {platform: [] for platform in platforms}
+    pending = {platform: [] for platform in platforms}
+    for platform in platforms:
         for test in SECURITY_TESTS:
-            result = docker_tester.run_test(test)
-            results["Docker"][test.name] = result
-            print(f"  {test.description}: {result.value}")
-        print()
-    elif args.skip_docker:
-        print("⏭️  Skipping Docker test")
+            result = cache.get(platform, testers[platform], test)
+            if result is None:
+                pending[platform].append(test)
+            else:
+                cached_pairs[platform].append((test, result))
+
+    # Load-sensitive tests are held back from the pool (see SERIAL_CATEGORIES)
+    serial = {
+        platform: [test for test in tests if test.category in SERIAL_CATEGORIES]
+        for platform, tests in pending.items()
+    }
+    pending = {
+        platform: [test for test in tests if test.category not in SERIAL_CATEGORIES]
+        for platform, tests in pending.items()
+    }
+
+    def record(platform: str, pairs):
+        for test, result in pairs:
+            cache.put(platform, testers[platform], test, result)
+        collect(platform, pairs)
+
+    # Every other (platform, test) pair is an independent child process, so
+    # run them on a thread pool and collect results as they finish
+    if platforms:
+        num_cached = sum(len(pairs) for pairs in cached_pairs.values())
+        num_pending = sum(len(tests) for tests in pending.values())
+        num_serial = sum(len(tests) for tests in serial.values())
+        print(f"Running {num_pending} tests with {args.jobs} workers ({num_cached} cached)...")
+        for platform in platforms:
+            if cached_pairs[platform]:
+                collect(platform, cached_pairs[platform], cached=True)
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {}
+            for platform in platforms:
+                tester = testers[platform]
+                if not pending[platform]:
+                    continue
+                if getattr(tester, "BATCH", False):
+                    # One batch for the whole platform; see PyodideSecurityTest.BATCH
+                    futures[executor.submit(tester.run_tests, pending[platform])] = platform
+                else:
+                    for test in pending[platform]:
+                        futures[executor.submit(run_tests_serially, tester, [test])] = platform
+            for future in as_completed(futures):
+                # One write per finished job (a whole batch for batch platforms)
+                record(futures[future], future.result())
+        if num_serial:
+            print(f"Running {num_serial} resource limit tests one at a time...")
+            for platform in platforms:
+                for test in serial[platform]:
+                    tester = testers[platform]
+                    if getattr(tester, "BATCH", False):
+                        record(platform, tester.run_tests([test]))
+                    else:
+                        record(platform, run_tests_serially(tester, [test]))
         print()
+    cache.save()
+
+    # Scores were computed as platforms finished; report them in platform order
+    scores = {platform: scores[platform] for platform in platforms}
+    if args.jsonl:
+        # Per-test and score records went out as results arrived
+        sys.stdout.flush()
     else:
-        print("⚠️  Docker not available, skipping test")
+        # Print results table
+        print("=" * 60)
+        print("Security Comparison Results")
+        print("=" * 60)
         print()
-    
-    # Pyodide Test
-    if not args.skip_pyodide:
-        print("🌐 Testing Pyodide (WebAssembly)...")
-        pyodide_tester = PyodideSecurityTest()
+        print_results_table(results, platforms)
 
-        # Check if Pyodide is really available
-        if not pyodide_tester.node_available:
-            print("⚠️  Node.js not available, skipping Pyodide test")
-            print()
-        else:
-            # Check if Pyodide is installed
-            if not pyodide_tester.pyodide_available:
-                print("⚠️  Pyodide npm package not installed, skipping test")
-                print("   Hint: Run 'npm install pyodide' to install")
-                print()
-            else:
-                results["Pyodide"] = {}
-                platforms.append("Pyodide")
-                
-                for test in SECURITY_TESTS:
-                    result = pyodide_tester.run_test(test)
-                    results["Pyodide"][test.name] = result
-                    print(f"  {test.description}: {result.value}")
-                print()
-    
-    # Claude SRT Test
-    if not args.skip_claude_srt and check_claude_srt_available():
-        print("🤖 Testing Claude SRT (Sandboxed Runtime)...")
-        claude_srt_tester = ClaudeSRTSecurityTest()
-        results["Claude SRT"] = {}
-        platforms.append("Claude SRT")
-        
-        for test in SECURITY_TESTS:
-            result = claude_srt_tester.run_test(test)
-            results["Claude SRT"][test.name] = result
-            print(f"  {test.description}: {result.value}")
-        
-        claude_srt_tester.cleanup()
-        print()
-    elif args.skip_claude_srt:
-        print("⏭️  Skipping Claude SRT test")
+        # Print security scores
+        print("## Security Score")
         print()
-    elif not check_claude_srt_available():
-        print("⚠️  Claude SRT not available, skipping test")
-        print("   Hint: Please ensure the srt command-line tool is installed")
+        print("| Platform | Blocked | Partial | Allowed | Security Score |")
+        print("|----------|---------|---------|---------|----------------|")
+        for platform in platforms:
+            s = scores[platform]
+            print(f"| {platform} | {s['blocked']} | {s['partial']} | {s['allowed']} | {s['score']:.1f}% |")
         print()
     
-    # Print results table
-    print("=" * 60)
-    print("Security Comparison Results")
-    print("=" * 60)
-    print()
-    print_results_table(results, platforms)
-
-    # Calculate and print security scores
-    scores = calculate_security_score(results)
-    print("## Security Score")
-    print()
-    print("| Platform | Blocked | Partial | Allowed | Security Score |")
-    print("|----------|---------|---------|---------|----------------|")
-    for platform in platforms:
-        s = scores[platform]
-        print(f"| {platform} | {s['blocked']} | {s['partial']} | {s['allowed']} | {s['score']:.1f}% |")
-    print()
-    
-    # Output JSON results
-    if args.output:
-        output_data = {
-            "results": {
-                platform: {name: result.name for name, result in platform_results.items()}
-                for platform, platform_results in results.items()
-            },
-            "scores": scores,
-            "tests": [
-                {
-                    "name": t.name,
-                    "category": t.category,
-                    "description": t.description
-                }
-                for t in SECURITY_TESTS
-            ]
-        }
-        with open(args.output, "w") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Finish JSON results; per-platform results were written as they completed
+    if writer:
+        writer.close(scores, [
+            {
+                "name": t.name,
+                "category": t.category,
+                "description": t.description
+            }
+            for t in SECURITY_TESTS
+        ], {platform: names for platform, names in cached_tests.items() if names})
         print(f"📄 Results saved to {args.output}")
 
     print("=" * 60)
@@ -5,11 +5,97 @@
 用于诊断性能测试中代码是否真的被执行
 """
 
+import atexit
 import subprocess
 import json
 import tempfile
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# 所有检查共用一个临时目录，退出时统一删除
+_SHARED_TMP = tempfile.mkdtemp(prefix="verify_execution_")
+atexit.register(shutil.rmtree, _SHARED_TMP, ignore_errors=True)
+
+
+def _work_dir(name):
+    """返回共享临时目录下的子目录"""
+    path = os.path.join(_SHARED_TMP, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _check_print(name, result):
+    if result.returncode == 0 and f"Hello from {name}!".encode() in result.stdout:
+        return "  ✓ 测试通过"
+    return "  ✗ 测试失败"
+
+
+def _check_json(name, result):
+    try:
+        output_json = json.loads(result.stdout)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return "  ✗ 测试失败 - 无法解析 JSON"
+    if output_json.get("test") == "success":
+        return "  ✓ 测试通过 - JSON 解析成功"
+    return "  ✗ 测试失败 - JSON 内容不正确"
+
+
+def _check_fib(name, result):
+    try:
+        output_json = json.loads(result.stdout)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return "  ✗ 测试失败 - 无法解析 JSON"
+    if output_json.get("result") == 6765:  # fib(20) = 6765
+        return "  ✓ 测试通过 - 计算结果正确"
+    return f"  ✗ 测试失败 - 期望 6765，得到 {output_json.get('result')}"
+
+
+# 每个平台都跑的测试用例: (标题, 代码, 检查函数)；代码中的 {name} 替换为平台名
+_CASES = [
+    ("简单 print 语句", 'print("Hello from {name}!")', _check_print),
+    ("JSON 输出", '''
+import json
+result = {"test": "success", "value": 42}
+print(json.dumps(result))
+''', _check_json),
+    ("计算任务 (fibonacci)", '''
+import json
+def fib(n):
+    if n <= 1: return n
+    return fib(n-1) + fib(n-2)
+result = fib(20)
+print(json.dumps({"result": result}))
+''', _check_fib),
+]
+
+
+def _run_case(name, run_case, index, title, code, check):
+    """运行一个用例，返回它要打印的各行"""
+    result = run_case(index, code.replace("{name}", name))
+    return [
+        f"\n[测试 {index}] {title}",
+        "-" * 70,
+        f"  返回码: {result.returncode}",
+        f"  标准输出: {result.stdout[:200].decode(errors='replace')}",
+        f"  标准错误: {result.stderr[:200].decode(errors='replace')}",
+        check(name, result),
+    ]
+
+
+def _run_cases(name, run_case):
+    """并行运行 _CASES，run_case(编号, 代码) 返回 CompletedProcess
+
+    用例之间没有共享状态；输出先缓存，再按用例顺序打印。
+    """
+    with ThreadPoolExecutor(max_workers=len(_CASES)) as pool:
+        futures = [
+            pool.submit(_run_case, name, run_case, index, title, code, check)
+            for index, (title, code, check) in enumerate(_CASES, 1)
+        ]
+        for future in futures:
+            print("\n".join(future.result()))
+
 
 def test_srt_execution():
     """测试 srt 是否正确执行 Python 代码"""
@@ -28,106 +114,21 @@ def test_srt_execution():
         print("   安装方法: brew install ripgrep")
         print("   继续测试，但可能会失败...\n")
     
-    work_dir = tempfile.mkdtemp(prefix="srt_verify_")
+    work_dir = _work_dir("srt")
     
-    try:
-        # 测试 1: 简单 print
-        print("\n[测试 1] 简单 print 语句")
-        print("-" * 70)
-        test_code = 'print("Hello from srt!")'
-        script_path = os.path.join(work_dir, "test1.py")
+    def run_case(index, code):
+        script_path = os.path.join(work_dir, f"test{index}.py")
         with open(script_path, "w") as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
+            f.write(code)
+        return subprocess.run(
             ["srt", "python3", script_path],
             capture_output=True,
             timeout=30,
             cwd=work_dir
         )
-        
-        print(f"  返回码: {result.returncode}")
-        print(f"  标准输出: {result.stdout.decode(errors='replace')[:200]}")
-        print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-        
-        if result.returncode == 0 and "Hello from srt!" in result.stdout.decode():
-            print("  ✓ 测试通过")
-        else:
-            print("  ✗ 测试失败")
-        
-        # 测试 2: JSON 输出
-        print("\n[测试 2] JSON 输出")
-        print("-" * 70)
-        test_code = '''
-import json
-result = {"test": "success", "value": 42}
-print(json.dumps(result))
-'''
-        script_path = os.path.join(work_dir, "test2.py")
-        with open(script_path, "w") as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
-            ["srt", "python3", script_path],
-            capture_output=True,
-            timeout=30,
-            cwd=work_dir
-        )
-        
-        print(f"  返回码: {result.returncode}")
-        stdout = result.stdout.decode(errors='replace')
-        print(f"  标准输出: {stdout[:200]}")
-        print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-        
-        try:
-            output_json = json.loads(stdout.strip())
-            if output_json.get("test") == "success":
-                print("  ✓ 测试通过 - JSON 解析成功")
-            else:
-                print("  ✗ 测试失败 - JSON 内容不正确")
-        except json.JSONDecodeError:
-            print("  ✗ 测试失败 - 无法解析 JSON")
-        
-        # 测试 3: 计算任务
-        print("\n[测试 3] 计算任务 (fibonacci)")
-        print("-" * 70)
-        test_code = '''
-import json
-def fib(n):
-    if n <= 1: return n
-    return fib(n-1) + fib(n-2)
-result = fib(20)
-print(json.dumps({"result": result}))
-'''
-        script_path = os.path.join(work_dir, "test3.py")
-        with open(script_path, "w") as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
-            ["srt", "python3", script_path],
-            capture_output=True,
-            timeout=30,
-            cwd=work_dir
-        )
-        
-        print(f"  返回码: {result.returncode}")
-        stdout = result.stdout.decode(errors='replace')
-        print(f"  标准输出: {stdout[:200]}")
-        print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-        
-        try:
-            output_json = json.loads(stdout.strip())
-            if output_json.get("result") == 6765:  # fib(20) = 6765
-                print("  ✓ 测试通过 - 计算结果正确")
-            else:
-                print(f"  ✗ 测试失败 - 期望 6765，得到 {output_json.get('result')}")
-        except json.JSONDecodeError:
-            print("  ✗ 测试失败 - 无法解析 JSON")
-        
-        return True
-        
-    finally:
-        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    _run_cases("srt", run_case)
+    return True
 
 
 def test_docker_execution():
@@ -154,87 +155,14 @@ def test_docker_execution():
         print("❌ Docker 不可用")
         return False
     
-    # 测试 1: 简单 print
-    print("\n[测试 1] 简单 print 语句")
-    print("-" * 70)
-    test_code = 'print("Hello from Docker!")'
-    
-    result = subprocess.run(
-        ["docker", "run", "--rm", "python:3.11-slim", "python", "-c", test_code],
-        capture_output=True,
-        timeout=60
-    )
-    
-    print(f"  返回码: {result.returncode}")
-    print(f"  标准输出: {result.stdout.decode(errors='replace')[:200]}")
-    print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-    
-    if result.returncode == 0 and "Hello from Docker!" in result.stdout.decode():
-        print("  ✓ 测试通过")
-    else:
-        print("  ✗ 测试失败")
-    
-    # 测试 2: JSON 输出
-    print("\n[测试 2] JSON 输出")
-    print("-" * 70)
-    test_code = '''
-import json
-result = {"test": "success", "value": 42}
-print(json.dumps(result))
-'''
-    
-    result = subprocess.run(
-        ["docker", "run", "--rm", "python:3.11-slim", "python", "-c", test_code],
-        capture_output=True,
-        timeout=60
-    )
-    
-    print(f"  返回码: {result.returncode}")
-    stdout = result.stdout.decode(errors='replace')
-    print(f"  标准输出: {stdout[:200]}")
-    print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-    
-    try:
-        output_json = json.loads(stdout.strip())
-        if output_json.get("test") == "success":
-            print("  ✓ 测试通过 - JSON 解析成功")
-        else:
-            print("  ✗ 测试失败 - JSON 内容不正确")
-    except json.JSONDecodeError:
-        print("  ✗ 测试失败 - 无法解析 JSON")
-    
-    # 测试 3: 计算任务
-    print("\n[测试 3] 计算任务 (fibonacci)")
-    print("-" * 70)
-    test_code = '''
-import json
-def fib(n):
-    if n <= 1: return n
-    return fib(n-1) + fib(n-2)
-result = fib(20)
-print(json.dumps({"result": result}))
-'''
-    
-    result = subprocess.run(
-        ["docker", "run", "--rm", "python:3.11-slim", "python", "-c", test_code],
-        capture_output=True,
-        timeout=60
-    )
-    
-    print(f"  返回码: {result.returncode}")
-    stdout = result.stdout.decode(errors='replace')
-    print(f"  标准输出: {stdout[:200]}")
-    print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-    
-    try:
-        output_json = json.loads(stdout.strip())
-        if output_json.get("result") == 6765:  # fib(20) = 6765
-            print("  ✓ 测试通过 - 计算结果正确")
-        else:
-            print(f"  ✗ 测试失败 - 期望 6765，得到 {output_json.get('result')}")
-    except json.JSONDecodeError:
-        print("  ✗ 测试失败 - 无法解析 JSON")
+    def run_case(index, code):
+        return subprocess.run(
+            ["docker", "run", "--rm", "python:3.11-slim", "python", "-c", code],
+            capture_output=True,
+            timeout=60
+        )
     
+    _run_cases("Docker", run_case)
     return True
 
 
@@ -248,112 +176,27 @@ def test_skillbox_execution():
         print("❌ skillbox 未找到")
         return False
     
-    work_dir = tempfile.mkdtemp(prefix="skillbox_verify_")
+    work_dir = _work_dir("skillbox")
     
-    try:
-        # 创建 skill 目录结构
-        skill_dir = os.path.join(work_dir, "test-skill")
+    def run_case(index, code):
+        # 每个用例一个 skill 目录，并行运行时不会互相覆盖 scripts/main.py
+        skill_dir = os.path.join(work_dir, f"test-skill-{index}")
         scripts_dir = os.path.join(skill_dir, "scripts")
         os.makedirs(scripts_dir, exist_ok=True)
         
         with open(os.path.join(skill_dir, "SKILL.md"), "w") as f:
             f.write("---\nname: test\nversion: 1.0.0\nentry_point: scripts/main.py\n---\n")
-        
-        # 测试 1: 简单 print
-        print("\n[测试 1] 简单 print 语句")
-        print("-" * 70)
-        test_code = 'print("Hello from Skillbox!")'
-        script_path = os.path.join(scripts_dir, "main.py")
-        with open(script_path, "w") as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
+        with open(os.path.join(scripts_dir, "main.py"), "w") as f:
+            f.write(code)
+        return subprocess.run(
             ["skillbox", "run", skill_dir, "{}"],
             capture_output=True,
             timeout=30,
             cwd=work_dir
         )
-        
-        print(f"  返回码: {result.returncode}")
-        print(f"  标准输出: {result.stdout.decode(errors='replace')[:200]}")
-        print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-        
-        if result.returncode == 0 and "Hello from Skillbox!" in result.stdout.decode():
-            print("  ✓ 测试通过")
-        else:
-            print("  ✗ 测试失败")
-        
-        # 测试 2: JSON 输出
-        print("\n[测试 2] JSON 输出")
-        print("-" * 70)
-        test_code = '''
-import json
-result = {"test": "success", "value": 42}
-print(json.dumps(result))
-'''
-        with open(script_path, "w") as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
-            ["skillbox", "run", skill_dir, "{}"],
-            capture_output=True,
-            timeout=30,
-            cwd=work_dir
-        )
-        
-        print(f"  返回码: {result.returncode}")
-        stdout = result.stdout.decode(errors='replace')
-        print(f"  标准输出: {stdout[:200]}")
-        print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-        
-        try:
-            output_json = json.loads(stdout.strip())
-            if output_json.get("test") == "success":
-                print("  ✓ 测试通过 - JSON 解析成功")
-            else:
-                print("  ✗ 测试失败 - JSON 内容不正确")
-        except json.JSONDecodeError:
-            print("  ✗ 测试失败 - 无法解析 JSON")
-        
-        # 测试 3: 计算任务
-        print("\n[测试 3] 计算任务 (fibonacci)")
-        print("-" * 70)
-        test_code = '''
-import json
-def fib(n):
-    if n <= 1: return n
-    return fib(n-1) + fib(n-2)
-result = fib(20)
-print(json.dumps({"result": result}))
-'''
-        with open(script_path, "w") as f:
-            f.write(test_code)
-        
-        result = subprocess.run(
-            ["skillbox", "run", skill_dir, "{}"],
-            capture_output=True,
-            timeout=30,
-            cwd=work_dir
-        )
-        
-        print(f"  返回码: {result.returncode}")
-        stdout = result.stdout.decode(errors='replace')
-        print(f"  标准输出: {stdout[:200]}")
-        print(f"  标准错误: {result.stderr.decode(errors='replace')[:200]}")
-        
-        try:
-            output_json = json.loads(stdout.strip())
-            if output_json.get("result") == 6765:  # fib(20) = 6765
-                print("  ✓ 测试通过 - 计算结果正确")
-            else:
-                print(f"  ✗ 测试失败 - 期望 6765，得到 {output_json.get('result')}")
-        except json.JSONDecodeError:
-            print("  ✗ 测试失败 - 无法解析 JSON")
-        
-        return True
-        
-    finally:
-        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    _run_cases("Skillbox", run_case)
+    return True
 
 
 if __name__ == "__main__":
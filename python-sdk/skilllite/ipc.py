@@ -62,9 +62,11 @@ class IPCClient:
     Batch-sends concurrent requests so daemon receives them together for parallel processing.
     """
 
-    def __init__(self, binary: str, cwd: str | None = None):
+    def __init__(self, binary: str, cwd: str | None = None, env: dict[str, str] | None = None):
         self.binary = binary
         self.cwd = cwd or os.getcwd()
+        # Extra variables for the daemon, layered over os.environ
+        self.env = dict(env) if env else {}
         self._process: subprocess.Popen | None = None
         self._request_id = 0
         self._id_lock = threading.Lock()
@@ -78,6 +80,7 @@ class IPCClient:
     def start(self) -> None:
         """Start the daemon process, writer thread, and response reader thread."""
         env = dict(os.environ)
+        env.update(self.env)
         env["SKILLLITE_AUTO_APPROVE"] = "1"
         env["SKILLLITE_QUIET"] = "1"
         env["RUST_LOG"] = "error"  # Suppress INFO/WARN to stdout (IPC channel)
@@ -158,6 +161,10 @@ class IPCClient:
                     pass
             self._pending.clear()
 
+    def is_running(self) -> bool:
+        """Whether the daemon process is started and has not exited."""
+        return self._process is not None and self._process.poll() is None
+
     def close(self) -> None:
         """Terminate the daemon."""
         self._shutdown.set()
@@ -179,7 +186,7 @@ class IPCClient:
 
     def _request(self, method: str, params: dict[str, Any], timeout: float = 60) -> dict[str, Any]:
         """Send JSON-RPC request, return result or raise on error. Safe for concurrent calls."""
-        if not self._process or self._process.poll() is not None:
+        if not self.is_running():
             raise RuntimeError("IPC daemon not running")
         with self._id_lock:
             self._request_id += 1
@@ -208,8 +215,9 @@ class IPCClient:
         *,
         sandbox_level: int = 3,
         allow_network: bool = False,
+        timeout: float = 60,
     ) -> dict[str, Any]:
-        """Run a skill. Returns {output, exit_code}."""
+        """Run a skill. Returns {output, exit_code}; raises queue.Empty after timeout seconds."""
         return self._request(
             "run",
             {
@@ -218,6 +226,7 @@ class IPCClient:
                 "allow_network": allow_network,
                 "sandbox_level": sandbox_level,
             },
+            timeout=timeout,
         )
 
     def exec(
@@ -228,8 +237,9 @@ class IPCClient:
         *,
         sandbox_level: int = 3,
         allow_network: bool = False,
+        timeout: float = 60,
     ) -> dict[str, Any]:
-        """Execute a script. Returns {output, exit_code}."""
+        """Execute a script. Returns {output, exit_code}; raises queue.Empty after timeout seconds."""
         return self._request(
             "exec",
             {
@@ -239,4 +249,5 @@ class IPCClient:
                 "allow_network": allow_network,
                 "sandbox_level": sandbox_level,
             },
+            timeout=timeout,
         )
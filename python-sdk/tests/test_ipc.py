@@ -77,3 +77,29 @@ def test_ipc_client_run_passes_params() -> None:
     assert params["sandbox_level"] == 3
     assert params["allow_network"] is True
     assert result["output"] == "done"
+
+
+def test_ipc_client_run_passes_timeout() -> None:
+    """IPCClient.run forwards its timeout to _request."""
+    client = ipc.IPCClient("/fake/skilllite")
+    client._request = MagicMock(return_value={"output": "", "exit_code": 0})
+
+    client.run("/skill/dir", "{}", timeout=5)
+
+    assert client._request.call_args[1]["timeout"] == 5
+
+
+def test_ipc_client_start_layers_env_over_os_environ() -> None:
+    """IPCClient.start passes its env to the daemon without touching os.environ."""
+    client = ipc.IPCClient("/fake/skilllite", cwd="/tmp", env={"SKILLBOX_SKILLS_ROOT": "/skills"})
+    with (
+        patch.dict("skilllite.ipc.os.environ", {"HOME": "/home/user"}, clear=True),
+        patch("skilllite.ipc.subprocess.Popen") as popen,
+        patch("skilllite.ipc.threading.Thread"),
+    ):
+        client.start()
+        assert "SKILLBOX_SKILLS_ROOT" not in ipc.os.environ
+
+    env = popen.call_args[1]["env"]
+    assert env["SKILLBOX_SKILLS_ROOT"] == "/skills"
+    assert env["HOME"] == "/home/user"